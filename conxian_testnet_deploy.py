@@ -13,6 +13,7 @@ import sys
 import json
 import time
 import argparse
+import traceback
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -24,7 +25,7 @@ if sys.platform == "win32":
 # Import our enhanced modules
 from stacksorbit_secrets import is_sensitive_key, redact_recursive, save_secure_config
 from enhanced_conxian_deployment import EnhancedConfigManager, EnhancedConxianDeployer
-from deployment_monitor import DeploymentMonitor
+from deployment_monitor import DeploymentMonitor, create_api_session
 from deployment_verifier import DeploymentVerifier, load_expected_contracts
 
 
@@ -46,6 +47,31 @@ class ConxianTestnetDeployer:
 
         print("✅ Configuration loaded and validated")
 
+        # Bolt ⚡: Hoist frequently used settings out of per-call dict lookups
+        self.network = self.config.get("NETWORK", "testnet")
+        self.system_address = self.config.get("SYSTEM_ADDRESS")
+
+        # Bolt ⚡: Parsed lazily from Clarinet.toml and reused across commands
+        self._expected_contracts: Optional[List[str]] = None
+
+        # Bolt ⚡: One pooled HTTP session shared by every monitor and verifier
+        # so repeated API calls reuse keep-alive connections.
+        self._session = create_api_session()
+
+    def _get_expected_contracts(self) -> List[str]:
+        """Load expected contracts once per deployer instance"""
+        if self._expected_contracts is None:
+            self._expected_contracts = load_expected_contracts()
+        return self._expected_contracts
+
+    def _new_monitor(self) -> DeploymentMonitor:
+        """Create a monitor bound to the shared HTTP session"""
+        return DeploymentMonitor(
+            network=self.network,
+            config=self.config,
+            session=self._session,
+        )
+
     def deploy_to_testnet(self, options: Dict) -> Dict:
         """Deploy Conxian protocol to testnet"""
         print("🚀 Conxian Protocol - Testnet Deployment")
@@ -55,7 +81,9 @@ class ConxianTestnetDeployer:
         self.config.update(options)
 
         # Initialize deployer
-        deployer = EnhancedConxianDeployer(self.config, self.verbose)
+        deployer = EnhancedConxianDeployer(
+            self.config, self.verbose, monitor=self._new_monitor()
+        )
 
         # Run pre-deployment checks
         if not options.get("skip_checks", False):
@@ -84,26 +112,28 @@ class ConxianTestnetDeployer:
 
     def _run_post_deployment_checks(self, results: Dict):
         """Run post-deployment verification"""
-        address = self.config.get("SYSTEM_ADDRESS")
+        address = self.system_address
         if not address:
             print("⚠️  Skipping verification - no address configured")
             return
 
         # Get expected contracts
-        expected_contracts = load_expected_contracts()
-
-        # Initialize verifier
-        verifier = DeploymentVerifier(
-            network=self.config.get("NETWORK", "testnet"), config=self.config
-        )
-
-        # Run verification
-        verification_results = verifier.run_comprehensive_verification(
-            expected_contracts
-        )
+        expected_contracts = self._get_expected_contracts()
+
+        # Initialize verifier; the context manager shuts down its check pool
+        with DeploymentVerifier(
+            network=self.network,
+            config=self.config,
+            session=self._session,
+        ) as verifier:
+            # Run verification; the deployed contract list is fetched once
+            # inside the run, after API connectivity passes
+            verification_results = verifier.run_comprehensive_verification(
+                expected_contracts
+            )
 
-        # Print summary
-        verifier.print_verification_summary()
+            # Print summary
+            verifier.print_verification_summary()
 
         # Save deployment manifest
         self._save_deployment_manifest(results, verification_results)
@@ -112,21 +142,24 @@ class ConxianTestnetDeployer:
         self, deployment_results: Dict, verification_results: Dict
     ):
         """Save comprehensive deployment manifest"""
+        # Bolt ⚡: Look up and count each result list once
+        num_successful = len(deployment_results.get("successful", []))
+        num_failed = len(deployment_results.get("failed", []))
+        num_skipped = len(deployment_results.get("skipped", []))
+
         manifest = {
             "deployment": {
                 "timestamp": datetime.now().isoformat(),
-                "network": self.config.get("NETWORK", "testnet"),
-                "deployer": self.config.get("SYSTEM_ADDRESS", ""),
+                "network": self.network,
+                "deployer": self.system_address or "",
                 "results": deployment_results,
                 "verification": verification_results,
             },
             "config": {
                 "deployment_mode": self.config.get("DEPLOYMENT_MODE", "full"),
-                "total_contracts": len(deployment_results.get("successful", []))
-                + len(deployment_results.get("failed", []))
-                + len(deployment_results.get("skipped", [])),
-                "successful": len(deployment_results.get("successful", [])),
-                "failed": len(deployment_results.get("failed", [])),
+                "total_contracts": num_successful + num_failed + num_skipped,
+                "successful": num_successful,
+                "failed": num_failed,
                 "gas_estimate": self._calculate_gas_estimate(deployment_results),
             },
             "metadata": {
@@ -141,7 +174,11 @@ class ConxianTestnetDeployer:
         manifest_path.parent.mkdir(exist_ok=True)
 
         # 🛡️ Sentinel: Use secure persistence with automatic redaction for restricted permissions.
-        save_secure_config(str(manifest_path), manifest, json_format=True)
+        # Bolt ⚡: fsync before the atomic swap so scripted readers never see a
+        # truncated manifest after a crash.
+        save_secure_config(
+            str(manifest_path), manifest, json_format=True, durable=True
+        )
 
         print(f"💾 Complete deployment manifest saved to {manifest_path}")
 
@@ -155,29 +192,26 @@ class ConxianTestnetDeployer:
         print("📊 Starting deployment monitoring...")
 
         # Initialize monitor
-        monitor = DeploymentMonitor(
-            network=self.config.get("NETWORK", "testnet"), config=self.config
-        )
+        monitor = self._new_monitor()
 
         # Show initial status
+        address = self.system_address
+        api_status, account_info, contracts = monitor.fetch_status(address)
+
         print("\n🌐 Network Status:")
-        api_status = monitor.check_api_status()
         print(f"   Status: {api_status['status']}")
         print(f"   Network: {api_status.get('network_id', 'unknown')}")
         print(f"   Block Height: {api_status.get('block_height', 0)}")
 
-        address = self.config.get("SYSTEM_ADDRESS")
         if address:
             print("\n👤 Account Status:")
 
-            account_info = monitor.get_account_info(address)
             if account_info:
                 balance = int(account_info.get("balance", 0)) / 1000000
                 print(f"   Balance: {balance} STX")
                 print(f"   Nonce: {account_info.get('nonce', 0)}")
 
             print("\n📦 Deployed Contracts:")
-            contracts = monitor.get_deployed_contracts(address)
             print(f"   Count: {len(contracts)}")
 
             for contract in contracts:
@@ -190,25 +224,39 @@ class ConxianTestnetDeployer:
 
             monitor_thread = monitor.start_monitoring()
 
+            last_height = api_status.get("block_height", 0)
             try:
-                while monitor.is_monitoring:
-                    time.sleep(1)
+                # Wake on new blocks instead of polling the monitoring flag
+                while monitor.is_monitoring.is_set():
+                    if not monitor.new_block.wait(timeout=5):
+                        continue
+                    monitor.new_block.clear()
+                    last_height = self._print_block_delta(monitor, last_height)
             except KeyboardInterrupt:
                 print("\n🛑 Stopping monitoring...")
 
             monitor.stop_monitoring()
             print("✅ Monitoring stopped")
 
+    def _print_block_delta(self, monitor: DeploymentMonitor, last_height: int) -> int:
+        """Print chain progress since the last observed block"""
+        height = monitor.last_block_height
+        if height > last_height:
+            print(f"🧱 Block {height} (+{height - last_height})")
+            if monitor.deployment_history:
+                print(f"   Deployments seen: {len(monitor.deployment_history)}")
+        return max(height, last_height)
+
     def verify_deployment(self, options: Dict) -> None:
         """Verify deployment completeness"""
         print("🔍 Running deployment verification...")
 
-        address = self.config.get("SYSTEM_ADDRESS")
+        address = self.system_address
         if not address:
             raise ValueError("SYSTEM_ADDRESS not configured")
 
         # Get expected contracts
-        expected_contracts = options.get("contracts") or load_expected_contracts()
+        expected_contracts = options.get("contracts") or self._get_expected_contracts()
 
         if not expected_contracts:
             print("⚠️  No contracts specified for verification")
@@ -217,16 +265,18 @@ class ConxianTestnetDeployer:
             )
             return
 
-        # Initialize verifier
-        verifier = DeploymentVerifier(
-            network=self.config.get("NETWORK", "testnet"), config=self.config
-        )
-
-        # Run comprehensive verification
-        results = verifier.run_comprehensive_verification(expected_contracts)
+        # Initialize verifier; the context manager shuts down its check pool
+        with DeploymentVerifier(
+            network=self.network,
+            config=self.config,
+            session=self._session,
+        ) as verifier:
+            # Run comprehensive verification; the deployed contract list is
+            # fetched once inside the run, after API connectivity passes
+            results = verifier.run_comprehensive_verification(expected_contracts)
 
-        # Print detailed summary
-        verifier.print_verification_summary()
+            # Print detailed summary
+            verifier.print_verification_summary()
 
         # Exit with appropriate code
         if results["overall_status"] != "success":
@@ -255,6 +305,7 @@ class ConxianTestnetDeployer:
         # Update configuration
         network = options.get("network", "testnet")
         self.config["NETWORK"] = network
+        self.network = network
 
         if options.get("api_key"):
             self.config["HIRO_API_KEY"] = options["api_key"]
@@ -274,11 +325,13 @@ class ConxianTestnetDeployer:
         """Run comprehensive diagnostics"""
         print("🔍 Running comprehensive diagnostics...")
 
-        # Load configuration
-        config = self.config_manager.load_config()
+        # Bolt ⚡: Reuse the configuration validated in __init__
+        config = self.config
 
         # Initialize deployer
-        deployer = EnhancedConxianDeployer(config, self.verbose)
+        deployer = EnhancedConxianDeployer(
+            config, self.verbose, monitor=self._new_monitor()
+        )
 
         # Run all checks
         print("\n📊 System Diagnostics:")
@@ -297,76 +350,44 @@ class ConxianTestnetDeployer:
 
         # Expected contracts
         print("\n📦 Expected Contracts:")
-        expected_contracts = load_expected_contracts()
+        expected_contracts = self._get_expected_contracts()
         print(f"   Total: {len(expected_contracts)} contracts")
 
         # Network status
         print("\n🌐 Network Status:")
-        monitor = DeploymentMonitor(config.get("NETWORK", "testnet"), config)
-        api_status = monitor.check_api_status()
+        monitor = self._new_monitor()
+        address = self.system_address
+        api_status, account_info, contracts = monitor.fetch_status(address)
         print(f"   API Status: {api_status['status']}")
         print(f"   Network: {api_status.get('network_id', 'unknown')}")
         print(f"   Block Height: {api_status.get('block_height', 0)}")
 
         # Account status
-        address = config.get("SYSTEM_ADDRESS")
         if address:
             print("\n👤 Account Status:")
-            account_info = monitor.get_account_info(address)
             if account_info:
                 balance = int(account_info.get("balance", 0)) / 1000000
                 print(f"   Balance: {balance} STX")
                 print(f"   Nonce: {account_info.get('nonce', 0)}")
 
             print("\n📦 Deployed Contracts:")
-            contracts = monitor.get_deployed_contracts(address)
             print(f"   Count: {len(contracts)}")
 
         print("\n📊 Diagnostics Complete")
         print(f"✅ Overall Status: {'READY' if checks_passed else 'NEEDS ATTENTION'}")
 
 
-def main():
-    """Main CLI function"""
-    parser = argparse.ArgumentParser(
-        description="Conxian Testnet Deployment - Enhanced Version",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Initialize setup
-  python conxian_testnet_deploy.py init --network testnet
-
-  # Run diagnostics
-  python conxian_testnet_deploy.py check --verbose
-
-  # Dry run deployment
-  python conxian_testnet_deploy.py deploy --dry-run
-
-  # Deploy specific category
-  python conxian_testnet_deploy.py deploy --category core
-
-  # Full deployment
-  python conxian_testnet_deploy.py deploy --batch-size 5
-
-  # Monitor deployment
-  python conxian_testnet_deploy.py monitor --follow
-
-  # Verify deployment
-  python conxian_testnet_deploy.py verify --contracts all-traits cxd-token dex-factory
-        """,
-    )
-
+def _add_global_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add options shared by every command"""
     parser.add_argument("--config", default=".env", help="Configuration file path")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument(
         "--network", choices=["devnet", "testnet", "mainnet"], default="testnet"
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Deploy command
-    deploy_parser = subparsers.add_parser("deploy", help="Deploy to testnet")
-    deploy_parser.add_argument(
+def _add_deploy_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--category",
         choices=[
             "core",
@@ -378,54 +399,116 @@ Examples:
             "monitoring",
         ],
     )
-    deploy_parser.add_argument(
+    parser.add_argument(
         "--batch-size", type=int, default=5, help="Contracts per batch"
     )
-    deploy_parser.add_argument("--dry-run", action="store_true", help="Perform dry run")
-    deploy_parser.add_argument(
+    parser.add_argument("--dry-run", action="store_true", help="Perform dry run")
+    parser.add_argument(
         "--skip-checks", action="store_true", help="Skip pre-deployment checks"
     )
-    deploy_parser.add_argument(
+    parser.add_argument(
         "--force", action="store_true", help="Force deployment despite check failures"
     )
 
-    # Check command
-    check_parser = subparsers.add_parser("check", help="Run diagnostics")
-    check_parser.add_argument(
+
+def _add_check_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--env-only", action="store_true", help="Check only environment"
     )
-    check_parser.add_argument(
+    parser.add_argument(
         "--network-only", action="store_true", help="Check only network"
     )
-    check_parser.add_argument(
+    parser.add_argument(
         "--compile-only", action="store_true", help="Check only compilation"
     )
 
-    # Monitor command
-    monitor_parser = subparsers.add_parser("monitor", help="Monitor deployment")
-    monitor_parser.add_argument(
+
+def _add_monitor_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--follow", action="store_true", help="Follow in real-time"
     )
-    monitor_parser.add_argument(
+    parser.add_argument(
         "--api-only", action="store_true", help="Check only API status"
     )
 
-    # Verify command
-    verify_parser = subparsers.add_parser("verify", help="Verify deployment")
-    verify_parser.add_argument(
+
+def _add_verify_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--contracts", nargs="*", help="Specific contracts to verify"
     )
-    verify_parser.add_argument(
+    parser.add_argument(
         "--comprehensive", action="store_true", help="Run comprehensive verification"
     )
 
-    # Init command
-    init_parser = subparsers.add_parser("init", help="Initialize setup")
-    init_parser.add_argument(
+
+def _add_init_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--generate-wallet", action="store_true", help="Generate wallet"
     )
-    init_parser.add_argument("--api-key", help="Hiro API key")
+    parser.add_argument("--api-key", help="Hiro API key")
+
+
+# Command name -> (help text, argument builder)
+SUBCOMMANDS = {
+    "deploy": ("Deploy to testnet", _add_deploy_arguments),
+    "check": ("Run diagnostics", _add_check_arguments),
+    "monitor": ("Monitor deployment", _add_monitor_arguments),
+    "verify": ("Verify deployment", _add_verify_arguments),
+    "init": ("Initialize setup", _add_init_arguments),
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, populating arguments only for `command`"""
+    parser = argparse.ArgumentParser(
+        description="Conxian Testnet Deployment - Enhanced Version",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Initialize setup
+  python conxian_testnet_deploy.py init --network testnet
+
+  # Run diagnostics
+  python conxian_testnet_deploy.py check --verbose
 
+  # Dry run deployment
+  python conxian_testnet_deploy.py deploy --dry-run
+
+  # Deploy specific category
+  python conxian_testnet_deploy.py deploy --category core
+
+  # Full deployment
+  python conxian_testnet_deploy.py deploy --batch-size 5
+
+  # Monitor deployment
+  python conxian_testnet_deploy.py monitor --follow
+
+  # Verify deployment
+  python conxian_testnet_deploy.py verify --contracts all-traits cxd-token dex-factory
+        """,
+    )
+    _add_global_arguments(parser)
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, (help_text, add_arguments) in SUBCOMMANDS.items():
+        # Bolt ⚡: Every command stays listed in --help, but only the
+        # invoked one pays for building its arguments.
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            add_arguments(subparser)
+
+    return parser
+
+
+def main():
+    """Main CLI function"""
+    # Bolt ⚡: Identify the command first so only its subparser is built.
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    _add_global_arguments(pre_parser)
+    pre_parser.add_argument("command", nargs="?")
+    pre_args, _ = pre_parser.parse_known_args()
+
+    parser = build_parser(pre_args.command)
     args = parser.parse_args()
 
     try:
@@ -435,6 +518,7 @@ Examples:
         # Override network if specified
         if args.network:
             deployer.config["NETWORK"] = args.network
+            deployer.network = args.network
 
         # Execute command
         if args.command == "deploy":
@@ -496,8 +580,6 @@ Examples:
         # 🛡️ Sentinel: Prevent sensitive information disclosure.
         if args.verbose:
             print(f"\n❌ Error: {e}")
-            import traceback
-
             traceback.print_exc()
         else:
             print("\n❌ An unexpected error occurred (use --verbose for details)")
@@ -11,14 +11,14 @@ Real-time monitoring and verification using Hiro API
 import os
 import json
 import time
-import requests
 import functools
+import importlib.util
 import threading
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
-import argparse
+from typing import TYPE_CHECKING, Dict, List, Optional, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from stacksorbit_secrets import (
     is_sensitive_key,
     is_placeholder,
@@ -27,6 +27,11 @@ from stacksorbit_secrets import (
     redact_recursive,
 )
 
+# Bolt ⚡: requests (and urllib3, certifi, idna...) dominates import time, so
+# it is only loaded once a session is actually created.
+if TYPE_CHECKING:
+    import requests
+
 # Setup colored logging
 try:
     import colorama
@@ -37,9 +42,112 @@ try:
 except ImportError:
     USE_COLORS = False
 
+if USE_COLORS:
+    # Bolt ⚡: Resolve a record's color with one dict lookup instead of a
+    # chain of level comparisons on every log line.
+    _LEVEL_COLORS = {
+        logging.CRITICAL: Fore.RED,
+        logging.ERROR: Fore.RED,
+        logging.WARNING: Fore.YELLOW,
+        logging.INFO: Fore.GREEN,
+    }
+    _RESET = Style.RESET_ALL
+
+    class ColoredFormatter(logging.Formatter):
+        """Console formatter that colors records by level"""
+
+        def format(self, record):
+            message = super().format(record)
+            color = _LEVEL_COLORS.get(record.levelno)
+            return f"{color}{message}{_RESET}" if color else message
+
+# Optional C-accelerated JSON parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional push feed for real-time monitoring
+# Bolt ⚡: websocket-client pulls in certifi and ssl setup when imported, so
+# only probe for it here and import it when a feed is actually opened.
+_HAS_WEBSOCKET = importlib.util.find_spec("websocket") is not None
+
+# Hiro API base URL per network
+API_URLS = {
+    "mainnet": "https://api.hiro.so",
+    "testnet": "https://api.testnet.hiro.so",
+    "devnet": "http://localhost:20443",
+}
+
+# Bolt ⚡: (connect, read) timeout for API requests; an unreachable host
+# fails within ~3s instead of waiting out the full read timeout.
+API_TIMEOUT = (3.05, 10)
+
+
+def _parse_json_response(response: "requests.Response"):
+    """Decode a JSON response body, using orjson when available"""
+    # Bolt ⚡: orjson parses the raw bytes directly, skipping requests' text
+    # decoding and the pure-Python parts of stdlib json on large payloads.
+    content = response.content
+    if orjson is not None and isinstance(content, (bytes, bytearray)):
+        return orjson.loads(content)
+    return response.json()
+
+
+def create_api_session(pool_maxsize: int = 32) -> "requests.Session":
+    """Create a pooled, retrying HTTP session for Hiro API calls"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Bolt ⚡: Size the pool for concurrent fan-out and retry transient
+    # gateway errors with backoff instead of surfacing them to the caller.
+    # Connection failures and read timeouts are not retried so an offline or
+    # stalled host fails fast; polling loops already try again on their next
+    # tick. Status retries are limited to idempotent GETs.
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({"GET"}),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {"User-Agent": "conxian-monitor", "Accept": "application/json"}
+    )
+    return session
+
 
-def cache_api_call(func):
-    """Decorator to cache API calls with a timeout."""
+def _persisted_cache_key(cache_key: Tuple) -> str:
+    """Render an in-memory cache key as the string used in the JSON cache file"""
+    name, args, kwargs = cache_key
+    key_args = "_".join(map(str, args))
+    key_kwargs = "_".join(f"{k}={v}" for k, v in kwargs)
+    return f"{name}_{key_args}_{key_kwargs}"
+
+
+def cache_api_call(
+    func: Optional[Callable] = None,
+    *,
+    ttl: Optional[float] = None,
+    cache_if: Optional[Callable] = None,
+):
+    """Decorator to cache API calls with a timeout.
+
+    Use bare for the monitor's default expiry, or as ``@cache_api_call(ttl=...)``
+    to give an endpoint its own lifetime in seconds. ``cache_if`` is an optional
+    predicate on the result; results it rejects are returned but not stored.
+    """
+    if func is None:
+        return functools.partial(cache_api_call, ttl=ttl, cache_if=cache_if)
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -47,41 +155,60 @@ def cache_api_call(func):
         # This is critical for polling loops and manual refreshes.
         bypass_cache = kwargs.pop("bypass_cache", False)
 
-        # Create a cache key from the function name and arguments
-        # Note: This is a simple key generation strategy. For complex arguments,
-        # a more robust method (like hashing a serialized version of args) might be needed.
-        key_args = [str(arg) for arg in args]
-        key_kwargs = [f"{k}={v}" for k, v in sorted(kwargs.items())]
-        cache_key = f"{func.__name__}_{'_'.join(key_args)}_{'_'.join(key_kwargs)}"
+        # Bolt ⚡: Key the in-memory cache by a tuple, which hashes in C; the
+        # string form needed for the JSON file is only built on a miss.
+        cache_key = (
+            func.__name__,
+            args,
+            tuple(sorted(kwargs.items())) if kwargs else (),
+        )
 
         if not bypass_cache:
             with self.cache_lock:
                 cached_data = self.cache.get(cache_key)
-                if (
-                    cached_data
-                    and (time.time() - cached_data["timestamp"]) < self.cache_expiry
-                ):
-                    self.logger.debug(f"Cache hit for {cache_key}")
+                # Bolt ⚡: Per-endpoint TTLs keep immutable data cached for long
+                # while volatile endpoints refresh quickly.
+                expiry = self.cache_expiry if ttl is None else ttl
+                if cached_data and (time.time() - cached_data["timestamp"]) < expiry:
+                    self.logger.debug("Cache hit for %s", cache_key)
                     return cached_data["data"]
 
-        self.logger.debug(f"Cache miss for {cache_key}, fetching from API")
+        self.logger.debug("Cache miss for %s, fetching from API", cache_key)
         # Execute the function if no valid cache entry is found
         result = func(self, *args, **kwargs)
 
+        # Bolt ⚡: Volatile results would only serve stale data, so skip storing them
+        if cache_if is not None and not cache_if(result):
+            return result
+
         # Store the new result in the cache
         cache_copy = None
         with self.cache_lock:
             # Bolt ⚡: Optimization - Only save if the data has actually changed
             # to avoid redundant disk writes for frequent identical updates (e.g. polling).
-            old_data = self.cache.get(cache_key, {}).get("data")
+            old_data = (self.cache.pop(cache_key, None) or {}).get("data")
+            disk_key = _persisted_cache_key(cache_key)
+            self.redacted_cache.pop(disk_key, None)
             now = time.time()
+            # Bolt ⚡: Re-inserting keeps dict order = least recently stored first
             self.cache[cache_key] = {"timestamp": now, "data": result}
 
             # Bolt ⚡: Incrementally redact only the new entry to avoid O(N) overhead.
-            redacted_result = redact_recursive(result, parent_key=cache_key)
-            self.redacted_cache[cache_key] = {"timestamp": now, "data": redacted_result}
+            redacted_result = redact_recursive(result, parent_key=disk_key)
+            self.redacted_cache[disk_key] = {
+                "timestamp": now,
+                "data": redacted_result,
+                "key": [cache_key[0], list(cache_key[1]), [list(kv) for kv in cache_key[2]]],
+            }
+
+            evicted = False
+            while len(self.cache) > self.cache_maxsize:
+                oldest_key = next(iter(self.cache))
+                del self.cache[oldest_key]
+                self.redacted_cache.pop(_persisted_cache_key(oldest_key), None)
+                evicted = True
 
-            if result != old_data:
+            if result != old_data or evicted:
                 # Bolt ⚡: Create a shallow copy of the REDACTED cache for background persistence.
                 # This ensures save_secure_config doesn't need to redact the whole thing again.
                 cache_copy = self.redacted_cache.copy()
@@ -97,16 +224,41 @@ def cache_api_call(func):
 class DeploymentMonitor:
     """Real-time deployment monitoring with Hiro API integration"""
 
-    def __init__(self, network: str = "testnet", config: Dict = None):
+    def __init__(
+        self,
+        network: str = "testnet",
+        config: Dict = None,
+        session: Optional["requests.Session"] = None,
+    ):
         self.network = network
         self.config = config or {}
         self.api_url = self._get_api_url()
-        self.session = requests.Session()
-        self.session.timeout = 30
+        # Bolt ⚡: Accept a shared session so callers can pool connections
+        # across several monitors instead of paying a TLS handshake each.
+        self.session = session or create_api_session()
 
         # Monitoring state
-        self.is_monitoring = False
+        # Bolt ⚡: Events rather than bools so waiters block without polling;
+        # `stop_event` wakes sleeping loops the moment monitoring is stopped.
+        self.is_monitoring = threading.Event()
+        self.stop_event = threading.Event()
+        # Bolt ⚡: Signalled whenever a fetch observes a new block height so
+        # followers can wake on chain progress instead of spinning on a timer.
+        self.new_block = threading.Event()
+        self.last_block_height = 0
+        # (address, nonce, fetched_at, contracts) from the last status fetch
+        self._contracts_snapshot = None
+        # Bolt ⚡: Prefer Hiro's websocket feed over polling when available
+        self.use_websocket = _HAS_WEBSOCKET and str(
+            self.config.get("MONITOR_WEBSOCKET", "true")
+        ).lower() not in ("0", "false", "no")
+        self._ws = None
         self.deployment_history = []
+        self.monitoring_started_at: Optional[float] = None
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._summary_lock = threading.Lock()
+        self._summary_pending = False
+        self._summary_writer: Optional[threading.Thread] = None
         self.contracts_deployed = set()
         self.failed_contracts = set()
 
@@ -116,13 +268,18 @@ class DeploymentMonitor:
         self.cache_path.parent.mkdir(exist_ok=True)
         self.cache_lock = threading.Lock()
         self.cache_expiry = 300  # Cache for 5 minutes
-        self.cache = self._load_cache()
+        # Bolt ⚡: Bound the cache so high-cardinality keys (tx ids) can't grow
+        # it without limit in long-running --follow sessions.
+        self.cache_maxsize = 512
         # Bolt ⚡: Initialize the redacted cache with already redacted data from disk.
-        self.redacted_cache = self.cache.copy()
+        self.redacted_cache = self._load_cache()
+        self.cache = self._restore_cache(self.redacted_cache)
 
         # Bolt ⚡: Add adaptive polling intervals to reduce API calls during inactivity.
-        self.min_poll_interval = 5  # Start with a 5-second interval
+        self.min_poll_interval = 3  # Start with a 3-second interval
         self.max_poll_interval = 60  # Cap at 60 seconds
+        # Gentler than doubling so detection stays quick shortly after activity
+        self.poll_backoff_factor = 1.5
         self.current_poll_interval = self.min_poll_interval
 
         # Setup logging
@@ -132,12 +289,31 @@ class DeploymentMonitor:
         """Load API cache from a file."""
         if self.cache_path.exists():
             try:
-                with open(self.cache_path, "r") as f:
-                    return json.load(f)
+                with open(self.cache_path, "rb") as f:
+                    raw = f.read()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
             except (json.JSONDecodeError, IOError) as e:
-                self.logger.warning(f"Could not load cache file: {e}")
+                self.logger.warning("Could not load cache file: %s", e)
         return {}
 
+    @staticmethod
+    def _restore_cache(persisted: Dict) -> Dict:
+        """Rebuild tuple-keyed cache entries from the persisted file.
+
+        Entries from older files carry no structured key and are dropped from
+        `persisted` so they don't linger in the file forever.
+        """
+        cache = {}
+        for disk_key, entry in list(persisted.items()):
+            key = entry.get("key") if isinstance(entry, dict) else None
+            if not key:
+                del persisted[disk_key]
+                continue
+            name, args, kwargs = key
+            cache_key = (name, tuple(args), tuple(tuple(kv) for kv in kwargs))
+            cache[cache_key] = {"timestamp": entry["timestamp"], "data": entry["data"]}
+        return cache
+
     def _save_cache(self, cache_data: Optional[Dict] = None):
         """Save API cache to a file."""
         try:
@@ -154,16 +330,26 @@ class DeploymentMonitor:
             # This eliminates a multi-millisecond O(N) bottleneck on every disk write.
             save_secure_config(str(self.cache_path), data, json_format=True, redact=False, indent=None)
         except Exception as e:
-            self.logger.error(f"Could not save cache file: {e}")
+            self.logger.error("Could not save cache file: %s", e)
+
+    @property
+    def api_url(self) -> str:
+        """Base URL of the Hiro API for this monitor"""
+        return self._api_url
+
+    @api_url.setter
+    def api_url(self, value: str):
+        # Bolt ⚡: Precompute endpoint prefixes once instead of formatting the
+        # full URL on every API call.
+        self._api_url = value
+        self._url_info = value + "/v2/info"
+        self._url_accounts = value + "/v2/accounts/"
+        self._url_transactions = value + "/v2/transactions/"
+        self._url_contract_interface = value + "/v2/contracts/interface/"
 
     def _get_api_url(self) -> str:
         """Get API URL for network"""
-        urls = {
-            "mainnet": "https://api.hiro.so",
-            "testnet": "https://api.testnet.hiro.so",
-            "devnet": "http://localhost:20443",
-        }
-        return urls.get(self.network, urls["testnet"])
+        return API_URLS.get(self.network, API_URLS["testnet"])
 
     def setup_logging(self):
         """Setup comprehensive logging"""
@@ -201,18 +387,6 @@ class DeploymentMonitor:
         console_handler.setLevel(log_level)
 
         if USE_COLORS:
-
-            class ColoredFormatter(logging.Formatter):
-                def format(self, record):
-                    message = super().format(record)
-                    if record.levelno >= logging.ERROR:
-                        return f"{Fore.RED}{message}{Style.RESET_ALL}"
-                    elif record.levelno >= logging.WARNING:
-                        return f"{Fore.YELLOW}{message}{Style.RESET_ALL}"
-                    elif record.levelno >= logging.INFO:
-                        return f"{Fore.GREEN}{message}{Style.RESET_ALL}"
-                    return message
-
             console_formatter = ColoredFormatter("%(levelname)s: %(message)s")
         else:
             console_formatter = logging.Formatter("%(levelname)s: %(message)s")
@@ -221,36 +395,141 @@ class DeploymentMonitor:
         self.logger.addHandler(console_handler)
 
     def start_monitoring(self, callback: Optional[Callable] = None):
-        """Start real-time monitoring"""
-        self.is_monitoring = True
+        """Start real-time monitoring, reusing the monitor thread if it's running"""
+        # Bolt ⚡: One monitor thread per instance; a second start would only
+        # double the API traffic.
+        if (
+            self.is_monitoring.is_set()
+            and self._monitor_thread is not None
+            and self._monitor_thread.is_alive()
+        ):
+            self.logger.debug("Monitoring already running")
+            return self._monitor_thread
+
+        self.stop_event.clear()
+        self.is_monitoring.set()
+        self.monitoring_started_at = time.time()
         self.logger.info("🚀 Starting deployment monitoring...")
 
-        # Initial API check
-        self.check_api_status()
-
-        # Start monitoring thread
-        monitor_thread = threading.Thread(
-            target=self._monitoring_loop, args=(callback,)
+        # Bolt ⚡: No blocking API check here; the loop's first tick fetches
+        # status right away, so the caller returns immediately.
+        self._monitor_thread = threading.Thread(
+            target=self._monitoring_loop, args=(callback,), name="deployment-monitor"
         )
-        monitor_thread.daemon = True
-        monitor_thread.start()
+        self._monitor_thread.daemon = True
+        self._monitor_thread.start()
+
+        return self._monitor_thread
 
-        return monitor_thread
+    def _get_ws_url(self) -> Optional[str]:
+        """Get the extended API websocket URL, if the network has one"""
+        if self.network == "devnet":
+            # Local node RPC doesn't serve the extended API
+            return None
+        return self.api_url.replace("https://", "wss://", 1) + "/extended/v1/ws"
+
+    def _stream_events(self, callback: Optional[Callable] = None) -> bool:
+        """Follow block and account events over the websocket feed.
+
+        Returns True once monitoring is stopped, False if the feed is unavailable
+        or drops, so the caller can fall back to polling.
+        """
+        url = self._get_ws_url()
+        if not url:
+            return False
+
+        try:
+            import websocket
+
+            ws = websocket.create_connection(url, timeout=10)
+        except Exception as e:
+            self.logger.info("Websocket feed unavailable, polling instead: %s", e)
+            return False
+
+        self._ws = ws
+        try:
+            subscriptions = [{"event": "block"}]
+            address = self.config.get("SYSTEM_ADDRESS")
+            if address:
+                subscriptions.append({"event": "address_tx_update", "address": address})
+            for request_id, params in enumerate(subscriptions, 1):
+                ws.send(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": request_id,
+                            "method": "subscribe",
+                            "params": params,
+                        }
+                    )
+                )
+
+            # Pick up anything that happened before the subscription
+            self._check_for_new_deployments()
+            self._check_network_health()
+
+            ws.settimeout(self.max_poll_interval)
+            while self.is_monitoring.is_set():
+                try:
+                    message = json.loads(ws.recv())
+                except websocket.WebSocketTimeoutException:
+                    # Idle feed: a ping doubles as the network health check
+                    ws.ping()
+                    continue
+
+                method = message.get("method")
+                if method == "block":
+                    self._note_block_height(message.get("params", {}).get("height", 0))
+                elif method == "address_tx_update":
+                    self._check_for_new_deployments()
+                else:
+                    continue
+
+                if callback:
+                    callback(self.get_monitoring_status())
+
+            return True
+
+        except Exception as e:
+            if not self.is_monitoring.is_set():
+                return True
+            self.logger.warning("Websocket feed lost, falling back to polling: %s", e)
+            return False
+        finally:
+            self._ws = None
+            try:
+                ws.close()
+            except Exception:
+                pass
 
     def _monitoring_loop(self, callback: Optional[Callable] = None):
         """Main monitoring loop"""
-        while self.is_monitoring:
+        # Bolt ⚡: Push events give near-instant detection with no idle requests;
+        # polling below is the fallback when the feed can't be used.
+        if self.use_websocket and self._stream_events(callback):
+            return
+
+        while self.is_monitoring.is_set():
             try:
                 # Bolt ⚡: Adaptive polling implementation.
-                # The polling interval starts at `min_poll_interval` and doubles
-                # on each check where no new deployment is found, up to `max_poll_interval`.
+                # The polling interval starts at `min_poll_interval` and grows by
+                # `poll_backoff_factor` on each check where no new deployment is found,
+                # up to `max_poll_interval`.
                 # This significantly reduces the number of API calls during periods of inactivity,
                 # making the monitor more efficient. If a new deployment is found, the interval is reset.
-                found_new = self._check_for_new_deployments()
-                self._check_network_health()
+                # Bolt ⚡: Fetch the tick's data once, concurrently, and share it
+                # between detection, health checks and the status callback.
+                address = self.config.get("SYSTEM_ADDRESS")
+                api_status, account_info, contracts = self.fetch_status(
+                    address, bypass_cache=True, include_contracts=callback is not None
+                )
+                found_new = self._check_for_new_deployments(account_info)
+                self._check_network_health(api_status)
 
                 if callback:
-                    callback(self.get_monitoring_status())
+                    callback(
+                        self._build_monitoring_status(api_status, account_info, contracts)
+                    )
 
                 if found_new:
                     self.current_poll_interval = self.min_poll_interval
@@ -259,48 +538,56 @@ class DeploymentMonitor:
                     )
                 else:
                     self.current_poll_interval = min(
-                        self.current_poll_interval * 2, self.max_poll_interval
+                        self.current_poll_interval * self.poll_backoff_factor,
+                        self.max_poll_interval,
                     )
                     self.logger.debug(
-                        f"Increasing poll interval to {self.current_poll_interval}s."
+                        "Increasing poll interval to %.1fs.", self.current_poll_interval
                     )
 
-                time.sleep(self.current_poll_interval)
+                if self.stop_event.wait(self.current_poll_interval):
+                    break
 
             except Exception as e:
-                self.logger.error(f"Monitoring error: {e}")
-                time.sleep(30)  # Wait longer on errors
+                self.logger.error("Monitoring error: %s", e)
+                if self.stop_event.wait(30):  # Wait longer on errors
+                    break
 
-    def _check_for_new_deployments(self) -> bool:
-        """Check for new contract deployments"""
+    def _check_for_new_deployments(self, account_info: Optional[Dict] = None) -> bool:
+        """Check for new contract deployments, optionally from prefetched account info"""
         address = self.config.get("SYSTEM_ADDRESS")
         if not address:
             return False
 
         try:
-            # Bolt ⚡: Bypass cache for account info in monitoring loops to ensure immediate detection.
-            account_info = self.get_account_info(address, bypass_cache=True)
+            if account_info is None:
+                # Bolt ⚡: Bypass cache for account info in monitoring loops to ensure immediate detection.
+                account_info = self.get_account_info(address, bypass_cache=True)
             if not account_info:
                 return False
 
-            nonce_raw = account_info.get("nonce", 0)
-            current_nonce = (
-                int(nonce_raw, 16)
-                if isinstance(nonce_raw, str) and nonce_raw.startswith("0x")
-                else int(nonce_raw)
-            )
+            current_nonce = self._to_int(account_info.get("nonce", 0))
 
             # Check if we have new transactions
             if current_nonce > len(self.deployment_history):
-                self.logger.info(f"📦 New deployment detected! Nonce: {current_nonce}")
+                self.logger.info("📦 New deployment detected! Nonce: %s", current_nonce)
                 self._analyze_new_deployment(current_nonce)
+                # Checkpoint so a crash doesn't lose the deployments seen so far
+                self.schedule_summary_save()
                 return True
 
         except Exception as e:
-            self.logger.error(f"Error checking deployments: {e}")
+            self.logger.error("Error checking deployments: %s", e)
 
         return False
 
+    @staticmethod
+    def _to_int(value) -> int:
+        """Parse an API integer that may be hex ("0x...") or decimal"""
+        if isinstance(value, str):
+            return int(value, 16) if value.startswith("0x") else int(value)
+        return int(value)
+
     def _analyze_new_deployment(self, nonce: int):
         """Analyze new deployment transaction"""
         address = self.config.get("SYSTEM_ADDRESS")
@@ -310,38 +597,48 @@ class DeploymentMonitor:
         try:
             # This would typically involve analyzing the transaction
             # For now, we'll just log the deployment
+            # Bolt ⚡: Store epoch seconds; ISO strings are only rendered for the summary
             deployment_info = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.time(),
                 "nonce": nonce,
                 "network": self.network,
                 "address": address,
             }
 
             self.deployment_history.append(deployment_info)
-            self.logger.info(f"📋 New deployment recorded: nonce {nonce}")
+            self.logger.info("📋 New deployment recorded: nonce %s", nonce)
 
         except Exception as e:
-            self.logger.error(f"Error analyzing deployment: {e}")
+            self.logger.error("Error analyzing deployment: %s", e)
 
-    def _check_network_health(self):
-        """Check network health and performance"""
+    def _check_network_health(self, api_status: Optional[Dict] = None):
+        """Check network health and performance, optionally from a prefetched status"""
         try:
-            api_status = self.check_api_status()
+            if api_status is None:
+                # Bolt ⚡: Bypass cache so the monitoring loop observes new blocks.
+                api_status = self.check_api_status(bypass_cache=True)
             if api_status["status"] != "online":
                 self.logger.warning(
-                    f"🌐 Network connectivity issue: {api_status.get('error', 'Unknown')}"
+                    "🌐 Network connectivity issue: %s",
+                    api_status.get("error", "Unknown"),
                 )
 
         except Exception as e:
-            self.logger.error(f"Network health check failed: {e}")
+            self.logger.error("Network health check failed: %s", e)
 
-    @cache_api_call
+    def _note_block_height(self, height: int):
+        """Record chain progress and wake followers on a new block"""
+        if height > self.last_block_height:
+            self.last_block_height = height
+            self.new_block.set()
+
+    @cache_api_call(ttl=30)
     def check_api_status(self) -> Dict:
         """Check Hiro API status."""
         try:
-            response = self.session.get(f"{self.api_url}/v2/info", timeout=10)
+            response = self.session.get(self._url_info, timeout=API_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json_response(response)
 
             status = {
                 "status": "online",
@@ -352,41 +649,48 @@ class DeploymentMonitor:
                 "tps": data.get("tps", 0),
             }
             self.logger.debug(
-                f"API Status: {status['network_id']} @ {status['block_height']}"
+                "API Status: %s @ %s", status["network_id"], status["block_height"]
             )
+            self._note_block_height(status["block_height"])
             return status
 
         except Exception as e:
-            self.logger.error(f"API status check failed: {e}")
+            self.logger.error("API status check failed: %s", e)
             return {"status": "offline", "error": str(e)}
 
-    @cache_api_call
+    @cache_api_call(ttl=5)
     def get_account_info(self, address: str) -> Optional[Dict]:
         """Get comprehensive account information."""
         try:
-            response = self.session.get(f"{self.api_url}/v2/accounts/{address}")
+            response = self.session.get(
+                self._url_accounts + address, timeout=API_TIMEOUT
+            )
             response.raise_for_status()
-            return response.json()
+            return _parse_json_response(response)
 
         except Exception as e:
-            self.logger.error(f"Error getting account info: {e}")
+            self.logger.error("Error getting account info: %s", e)
             return None
 
-    @cache_api_call
+    # Bolt ⚡: Only settled transactions are cached; a cached "pending" would
+    # hide status transitions from callers polling without bypass_cache.
+    @cache_api_call(cache_if=lambda tx: tx is not None and tx.get("tx_status") != "pending")
     def get_transaction_info(self, tx_id: str) -> Optional[Dict]:
         """Get detailed transaction information"""
         try:
-            response = self.session.get(f"{self.api_url}/v2/transactions/{tx_id}")
+            response = self.session.get(
+                self._url_transactions + tx_id, timeout=API_TIMEOUT
+            )
             response.raise_for_status()
-            return response.json()
+            return _parse_json_response(response)
 
         except Exception as e:
-            self.logger.error(f"Error getting transaction info: {e}")
+            self.logger.error("Error getting transaction info: %s", e)
             return None
 
     def wait_for_transaction(self, tx_id: str, timeout: int = 300) -> Optional[Dict]:
         """Wait for transaction confirmation with exponential backoff."""
-        self.logger.info(f"⏳ Waiting for transaction confirmation: {tx_id}")
+        self.logger.info("⏳ Waiting for transaction confirmation: %s", tx_id)
 
         start_time = time.time()
         last_status = None
@@ -406,7 +710,7 @@ class DeploymentMonitor:
                 status = tx_info.get("tx_status", "unknown")
 
                 if status != last_status:
-                    self.logger.info(f"📊 Transaction status: {status}")
+                    self.logger.info("📊 Transaction status: %s", status)
                     last_status = status
                     poll_interval = 2  # Reset interval on status change
 
@@ -415,7 +719,8 @@ class DeploymentMonitor:
                     return tx_info
                 elif status == "error":
                     self.logger.error(
-                        f"❌ Transaction failed: {tx_info.get('tx_result', 'Unknown error')}"
+                        "❌ Transaction failed: %s",
+                        tx_info.get("tx_result", "Unknown error"),
                     )
                     return tx_info
 
@@ -439,20 +744,20 @@ class DeploymentMonitor:
         """Get list of deployed contracts."""
         try:
             response = self.session.get(
-                f"{self.api_url}/v2/accounts/{address}/contracts"
+                self._url_accounts + address + "/contracts", timeout=API_TIMEOUT
             )
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json_response(response)
 
             # Bolt ⚡: Robustly extract contracts from either 'contracts' or 'results' key.
             # Hiro API responses vary by version/endpoint.
             contracts = data.get("contracts") or data.get("results", [])
 
-            self.logger.info(f"📦 Found {len(contracts)} deployed contracts")
+            self.logger.info("📦 Found %s deployed contracts", len(contracts))
             return contracts
 
         except Exception as e:
-            self.logger.error(f"Error getting deployed contracts: {e}")
+            self.logger.error("Error getting deployed contracts: %s", e)
             return []
 
     @cache_api_call
@@ -460,33 +765,47 @@ class DeploymentMonitor:
         """Get recent transactions for an address."""
         try:
             response = self.session.get(
-                f"{self.api_url}/v2/accounts/{address}/transactions?limit={limit}",
-                timeout=10,
+                self._url_accounts + address + "/transactions",
+                params={"limit": limit},
+                timeout=API_TIMEOUT,
             )
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json_response(response)
             return data.get("results", [])
 
         except Exception as e:
-            self.logger.error(f"Error getting recent transactions: {e}")
+            self.logger.error("Error getting recent transactions: %s", e)
             return []
 
-    @cache_api_call
+    @cache_api_call(ttl=3600)
     def get_contract_details(self, contract_id: str) -> Optional[Dict]:
         """Get contract details, including source code."""
         try:
             # The contract_id is in the format 'address.name'
             address, name = contract_id.split(".")
-            url = f"{self.api_url}/v2/contracts/interface/{address}/{name}"
-            response = self.session.get(url)
+            url = self._url_contract_interface + address + "/" + name
+            response = self.session.get(url, timeout=API_TIMEOUT)
             response.raise_for_status()
             # We are primarily interested in the source code
-            source_data = response.json()
+            source_data = _parse_json_response(response)
             return {"source_code": source_data.get("source", "Source not available")}
         except Exception as e:
-            self.logger.error(f"Error getting contract details for {contract_id}: {e}")
+            self.logger.error("Error getting contract details for %s: %s", contract_id, e)
             return None
 
+    def get_contract_details_batch(
+        self, contract_ids: List[str], max_workers: int = 8
+    ) -> Dict[str, Optional[Dict]]:
+        """Fetch details for several contracts with bounded concurrency"""
+        unique_ids = list(dict.fromkeys(contract_ids))
+        if len(unique_ids) <= 1:
+            return {cid: self.get_contract_details(cid) for cid in unique_ids}
+
+        # Bolt ⚡: Overlap the lookups, but cap requests in flight so bulk
+        # verification stays within Hiro's rate limits.
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            return dict(zip(unique_ids, executor.map(self.get_contract_details, unique_ids)))
+
     def verify_deployment(self, expected_contracts: List[str], address: str) -> Dict:
         """Verify deployment completeness"""
         self.logger.info("🔍 Verifying deployment...")
@@ -506,51 +825,101 @@ class DeploymentMonitor:
             "address": address,
             "expected": expected_contracts,
             "deployed": deployed_names,
-            "verified": [],
-            "missing": [],
-            "extra": [],
+            # Set membership keeps these O(n + m) while preserving input order;
+            # redeployed names are only reported once as extra.
+            "verified": [c for c in expected_contracts if c in deployed_names_set],
+            "missing": [c for c in expected_contracts if c not in deployed_names_set],
+            "extra": [
+                d for d in dict.fromkeys(deployed_names) if d not in expected_contracts_set
+            ],
         }
 
-        # Check expected contracts
-        for contract in expected_contracts:
-            if contract in deployed_names_set:
-                verification["verified"].append(contract)
-                self.logger.info(f"✅ {contract}")
-            else:
-                verification["missing"].append(contract)
-                self.logger.error(f"❌ {contract} (missing)")
-
-        # Check for unexpected contracts
-        for deployed in deployed_names:
-            if deployed not in expected_contracts_set:
-                verification["extra"].append(deployed)
-                self.logger.warning(f"⚠️  {deployed} (unexpected)")
+        for contract in verification["verified"]:
+            self.logger.info("✅ %s", contract)
+        for contract in verification["missing"]:
+            self.logger.error("❌ %s (missing)", contract)
+        for deployed in verification["extra"]:
+            self.logger.warning("⚠️  %s (unexpected)", deployed)
 
         # Summary
         verification["success"] = len(verification["missing"]) == 0
 
         self.logger.info("📊 Verification Summary:")
-        self.logger.info(f"   Expected: {len(verification['expected'])}")
-        self.logger.info(f"   Verified: {len(verification['verified'])}")
-        self.logger.info(f"   Missing: {len(verification['missing'])}")
-        self.logger.info(f"   Extra: {len(verification['extra'])}")
+        self.logger.info("   Expected: %s", len(verification["expected"]))
+        self.logger.info("   Verified: %s", len(verification["verified"]))
+        self.logger.info("   Missing: %s", len(verification["missing"]))
+        self.logger.info("   Extra: %s", len(verification["extra"]))
 
         return verification
 
-    def get_monitoring_status(self) -> Dict:
-        """Get current monitoring status"""
-        api_status = self.check_api_status()
+    def fetch_status(
+        self,
+        address: Optional[str],
+        bypass_cache: bool = False,
+        include_contracts: bool = True,
+    ) -> Tuple[Dict, Optional[Dict], List[Dict]]:
+        """Fetch API status, account info and deployed contracts concurrently.
+
+        bypass_cache refetches the volatile status and account info; the
+        contract list always goes through its own cache.
+        """
+        if not address:
+            return self.check_api_status(bypass_cache=bypass_cache), None, []
+
+        # Bolt ⚡: An address's contract list only changes when its nonce
+        # moves, so a recent list is reused while the nonce stays put.
+        snapshot = self._contracts_snapshot
+        reusable = (
+            include_contracts
+            and snapshot is not None
+            and snapshot[0] == address
+            and time.time() - snapshot[2] < self.cache_expiry
+        )
 
-        address = self.config.get("SYSTEM_ADDRESS")
-        account_info = None
-        deployed_contracts = []
+        # Bolt ⚡: The RPCs are independent, so overlap them to pay roughly
+        # one round trip instead of one per call.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            api_future = executor.submit(self.check_api_status, bypass_cache=bypass_cache)
+            account_future = executor.submit(
+                self.get_account_info, address, bypass_cache=bypass_cache
+            )
+            contracts_future = (
+                executor.submit(self.get_deployed_contracts, address)
+                if include_contracts and not reusable
+                else None
+            )
+            api_status = api_future.result()
+            account_info = account_future.result()
+            contracts = contracts_future.result() if contracts_future else []
+
+        if not include_contracts:
+            return api_status, account_info, contracts
+
+        nonce = account_info.get("nonce") if account_info else None
+        if reusable:
+            if nonce == snapshot[1]:
+                return api_status, account_info, snapshot[3]
+            # The nonce moved, so the cached list is stale
+            contracts = self.get_deployed_contracts(address, bypass_cache=True)
 
-        if address:
-            account_info = self.get_account_info(address)
-            deployed_contracts = self.get_deployed_contracts(address)
+        if nonce is not None:
+            self._contracts_snapshot = (address, nonce, time.time(), contracts)
+        return api_status, account_info, contracts
 
+    def get_monitoring_status(self) -> Dict:
+        """Get current monitoring status"""
+        address = self.config.get("SYSTEM_ADDRESS")
+        return self._build_monitoring_status(*self.fetch_status(address))
+
+    def _build_monitoring_status(
+        self,
+        api_status: Dict,
+        account_info: Optional[Dict],
+        deployed_contracts: List[Dict],
+    ) -> Dict:
+        """Assemble the monitoring status from already fetched data"""
         return {
-            "monitoring_active": self.is_monitoring,
+            "monitoring_active": self.is_monitoring.is_set(),
             "api_status": api_status,
             "account_info": account_info,
             "deployed_contracts": len(deployed_contracts),
@@ -561,28 +930,77 @@ class DeploymentMonitor:
     def stop_monitoring(self):
         """Stop monitoring"""
         self.logger.info("🛑 Stopping deployment monitoring...")
-        self.is_monitoring = False
+        self.is_monitoring.clear()
+        self.stop_event.set()
+        # Unblock a websocket reader waiting on the next event
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
 
         # Save monitoring summary
-        self.save_monitoring_summary()
+        self.schedule_summary_save()
+
+    def schedule_summary_save(self):
+        """Save the monitoring summary on a background writer thread.
+
+        Requests made while a write is in flight are coalesced into a single
+        follow-up write of the latest state.
+        """
+        # Bolt ⚡: Keep file I/O off the caller's thread (Ctrl-C, UI) while the
+        # non-daemon writer still guarantees the final write lands before exit.
+        with self._summary_lock:
+            self._summary_pending = True
+            if self._summary_writer is not None:
+                return
+            self._summary_writer = threading.Thread(
+                target=self._drain_summary_saves, name="monitoring-summary-writer"
+            )
+            self._summary_writer.start()
+
+    def _drain_summary_saves(self):
+        """Write summaries until no further save has been requested"""
+        try:
+            while True:
+                with self._summary_lock:
+                    if not self._summary_pending:
+                        return
+                    self._summary_pending = False
+                try:
+                    self.save_monitoring_summary()
+                except Exception as e:
+                    # Keep draining so a later request still gets written
+                    self.logger.error("Could not save monitoring summary: %s", e)
+        finally:
+            with self._summary_lock:
+                if self._summary_writer is threading.current_thread():
+                    self._summary_writer = None
 
     def save_monitoring_summary(self):
         """Save monitoring summary to file"""
+        now = time.time()
+        started = self.monitoring_started_at
         summary = {
-            "end_time": datetime.now().isoformat(),
+            "end_time": datetime.fromtimestamp(now).isoformat(),
             "network": self.network,
             "total_deployments": len(self.deployment_history),
             "contracts_deployed": len(self.contracts_deployed),
             "failed_contracts": len(self.failed_contracts),
-            "monitoring_duration": "unknown",  # Would need start time tracking
+            "monitoring_duration": round(now - started, 1) if started else "unknown",
+            "deployments": [
+                {**entry, "timestamp": datetime.fromtimestamp(entry["timestamp"]).isoformat()}
+                for entry in self.deployment_history
+            ],
         }
 
         summary_path = Path("logs") / "monitoring_summary.json"
         summary_path.parent.mkdir(exist_ok=True)
         # 🛡️ Sentinel: Use secure persistence with automatic redaction and 0600 permissions.
-        save_secure_config(str(summary_path), summary, json_format=True)
+        save_secure_config(str(summary_path), summary, json_format=True, durable=True)
 
-        self.logger.info(f"💾 Monitoring summary saved to {summary_path}")
+        self.logger.info("💾 Monitoring summary saved to %s", summary_path)
 
     def _show_deployment_cost_warnings(self, available_stx: float):
         """Show deployment cost warnings based on available balance"""
@@ -615,6 +1033,8 @@ class DeploymentMonitor:
 
 def main():
     """Main monitoring CLI function"""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Conxian Deployment Monitor")
     parser.add_argument("--config", default=".env", help="Configuration file path")
     parser.add_argument(
@@ -638,21 +1058,21 @@ def main():
         # Load configuration
         config = {}
         if Path(args.config).exists():
-            with open(args.config, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        k, v = key.strip(), value.strip().strip('"')
-                        # 🛡️ Sentinel: Enforce security policy - no secrets in .env
-                        if is_sensitive_key(k) and not is_placeholder(v):
-                            error_message = (
-                                f"🛡️ Sentinel Security Error: Secret key '{k}' found in .env file.\n"
-                                "   Storing secrets in plaintext files is a critical security risk and is not permitted.\n"
-                                f"   Example: export {k}='your_secret_value_here'"
-                            )
-                            raise ValueError(error_message)
-                        config[k] = v
+            from dotenv import dotenv_values
+
+            # Bolt ⚡: Reuse python-dotenv's parser instead of a hand-rolled loop
+            for k, v in dotenv_values(dotenv_path=args.config).items():
+                if v is None:
+                    continue  # Bare keys without "=" carry no value
+                # 🛡️ Sentinel: Enforce security policy - no secrets in .env
+                if is_sensitive_key(k) and not is_placeholder(v):
+                    error_message = (
+                        f"🛡️ Sentinel Security Error: Secret key '{k}' found in .env file.\n"
+                        "   Storing secrets in plaintext files is a critical security risk and is not permitted.\n"
+                        f"   Example: export {k}='your_secret_value_here'"
+                    )
+                    raise ValueError(error_message)
+                config[k] = v
 
         # Override with command line arguments
         if args.network:
@@ -695,9 +1115,11 @@ def main():
             monitor_thread = monitor.start_monitoring()
 
             try:
-                # Keep main thread alive
-                while monitor.is_monitoring:
-                    time.sleep(1)
+                # Keep main thread alive, waking only when a new block arrives
+                while monitor.is_monitoring.is_set():
+                    if monitor.new_block.wait(timeout=5):
+                        monitor.new_block.clear()
+                        print(f"🧱 New block: {monitor.last_block_height}")
 
             except KeyboardInterrupt:
                 print("\n🛑 Stopping monitor...")
@@ -718,27 +1140,16 @@ def main():
                 print(f"\n👤 Account Status:")
                 account_info = monitor.get_account_info(address)
                 if account_info:
-                    balance_raw = account_info.get("balance", 0)
-                    balance_microstx = (
-                        int(balance_raw, 16)
-                        if isinstance(balance_raw, str) and balance_raw.startswith("0x")
-                        else int(balance_raw)
+                    balance_stx = (
+                        DeploymentMonitor._to_int(account_info.get("balance", 0))
+                        / 1000000
                     )
-                    balance_stx = balance_microstx / 1000000
-
-                    locked_raw = account_info.get("locked", 0)
                     locked_balance = (
-                        int(locked_raw, 16)
-                        if isinstance(locked_raw, str) and locked_raw.startswith("0x")
-                        else int(locked_raw)
-                    ) / 1000000
-                    available_stx = balance_stx - locked_balance
-                    nonce_raw = account_info.get("nonce", 0)
-                    nonce = (
-                        int(nonce_raw, 16)
-                        if isinstance(nonce_raw, str) and nonce_raw.startswith("0x")
-                        else int(nonce_raw)
+                        DeploymentMonitor._to_int(account_info.get("locked", 0))
+                        / 1000000
                     )
+                    available_stx = balance_stx - locked_balance
+                    nonce = DeploymentMonitor._to_int(account_info.get("nonce", 0))
 
                     # Helper function to get recent transactions
                     def get_recent_transactions(address, limit=10):
@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import dotenv_values
 from stacksorbit_secrets import (
     SECRET_KEYS,
@@ -646,49 +647,144 @@ class EnhancedConxianDeployer:
 
         results = {"successful": [], "failed": [], "skipped": []}
 
-        # Deploy contracts in dependency order
-        for i, contract in enumerate(contracts, 1):
-            print(f"\n[{i}/{len(contracts)}] Deploying {contract['name']}...")
-
-            try:
-                tx_id = self._deploy_single_contract(contract)
-                if tx_id:
-                    # Monitor transaction
-                    confirmed = self.monitor.wait_for_confirmation(
-                        tx_id, int(self.config.get("CONFIRMATION_TIMEOUT", 300))
-                    )
-
-                    if confirmed:
-                        print(f"[SUCCESS] {contract['name']} deployed successfully")
-                        results["successful"].append(
-                            {"name": contract["name"], "tx_id": tx_id}
-                        )
-                    else:
-                        print(f"[TIMEOUT] {contract['name']} deployment timed out")
-                        results["failed"].append(
-                            {"name": contract["name"], "error": "timeout"}
+        # Bolt ⚡: Deploy independent contracts concurrently, one batch at a time.
+        # Each batch only contains contracts whose dependencies were confirmed in
+        # an earlier batch, so wall-clock per batch is the slowest confirmation
+        # instead of the sum. Broadcasts stay sequential and the nonce only
+        # advances after a successful broadcast, so a failed contract never
+        # leaves a nonce gap that stalls every later transaction.
+        next_nonce = self._get_starting_nonce()
+        batch_size = self._get_batch_size()
+        if next_nonce is None:
+            # Without a known nonce the deploy script derives it from the
+            # confirmed account nonce, so back-to-back broadcasts would all
+            # reuse it. Confirm each contract before broadcasting the next.
+            batch_size = 1
+        batches = self._plan_deployment_batches(contracts, batch_size)
+        position = 0
+
+        with ThreadPoolExecutor(max_workers=batch_size) as executor:
+            for batch_index, batch in enumerate(batches):
+                pending = []
+                for contract in batch:
+                    position += 1
+                    print(f"\n[{position}/{len(contracts)}] Deploying {contract['name']}...")
+                    try:
+                        tx_id = self._deploy_single_contract(contract, nonce=next_nonce)
+                    except Exception as e:
+                        self._report_deploy_error(contract, e)
+                        pending.append((contract, {"name": contract["name"], "error": str(e)}))
+                        continue
+
+                    if not tx_id:
+                        pending.append(
+                            (contract, {"name": contract["name"], "error": "deployment failed"})
                         )
-                else:
-                    results["failed"].append(
-                        {"name": contract["name"], "error": "deployment failed"}
-                    )
+                        continue
 
-            except Exception as e:
-                # 🛡️ Sentinel: Prevent sensitive information disclosure.
-                if self.verbose:
-                    print(f"[ERROR] {contract['name']} failed: {e}")
-                else:
-                    print(f"[ERROR] {contract['name']} failed (use --verbose for details)")
-                results["failed"].append({"name": contract["name"], "error": str(e)})
+                    if next_nonce is not None:
+                        next_nonce += 1
+                    pending.append(
+                        (contract, executor.submit(self._confirm_deployment, contract, tx_id))
+                    )
 
-            # Small delay between deployments
-            time.sleep(2)
+                # Collect in broadcast order to keep results in dependency order
+                for contract, item in pending:
+                    if isinstance(item, dict):
+                        results["failed"].append(item)
+                        continue
+                    try:
+                        outcome, entry = item.result()
+                        results[outcome].append(entry)
+                    except Exception as e:
+                        self._report_deploy_error(contract, e)
+                        results["failed"].append({"name": contract["name"], "error": str(e)})
+
+                # Small delay between batches
+                if batch_index < len(batches) - 1:
+                    time.sleep(2)
 
         # Save deployment results
         self._save_deployment_results(results)
 
         return results
 
+    def _get_batch_size(self) -> int:
+        """Get the number of contracts to deploy concurrently"""
+        try:
+            batch_size = int(
+                self.config.get("batch_size") or self.config.get("BATCH_SIZE", 5)
+            )
+        except (TypeError, ValueError):
+            batch_size = 5
+        return max(1, batch_size)
+
+    def _get_starting_nonce(self) -> Optional[int]:
+        """Get the next account nonce from a single account lookup"""
+        address = self.config.get("SYSTEM_ADDRESS")
+        if not address:
+            return None
+
+        try:
+            account_info = self.monitor.get_account_info(address, bypass_cache=True)
+            if not account_info:
+                return None
+            return DeploymentMonitor._to_int(account_info.get("nonce", 0))
+        except Exception:
+            # Let the deployment script resolve nonces itself
+            return None
+
+    def _plan_deployment_batches(
+        self, contracts: List[Dict], batch_size: int
+    ) -> List[List[Dict]]:
+        """Group dependency-ordered contracts into batches of independent contracts"""
+        batches: List[List[Dict]] = []
+        current: List[Dict] = []
+        current_names = set()
+
+        for contract in contracts:
+            depends_on = contract.get("depends_on") or []
+            # Start a new batch when full or when a dependency is still in flight
+            if current and (
+                len(current) >= batch_size
+                or any(dep in current_names for dep in depends_on)
+            ):
+                batches.append(current)
+                current = []
+                current_names = set()
+
+            current.append(contract)
+            current_names.add(contract["name"])
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _report_deploy_error(self, contract: Dict, error: Exception) -> None:
+        """Print a deployment error without leaking details unless verbose"""
+        # 🛡️ Sentinel: Prevent sensitive information disclosure.
+        if self.verbose:
+            print(f"[ERROR] {contract['name']} failed: {error}")
+        else:
+            print(f"[ERROR] {contract['name']} failed (use --verbose for details)")
+
+    def _confirm_deployment(self, contract: Dict, tx_id: str) -> Tuple[str, Dict]:
+        """Wait for a broadcast deployment to confirm.
+
+        Returns the results bucket ("successful" or "failed") and its entry.
+        """
+        confirmed = self.monitor.wait_for_confirmation(
+            tx_id, int(self.config.get("CONFIRMATION_TIMEOUT", 300))
+        )
+
+        if confirmed:
+            print(f"[SUCCESS] {contract['name']} deployed successfully")
+            return "successful", {"name": contract["name"], "tx_id": tx_id}
+
+        print(f"[TIMEOUT] {contract['name']} deployment timed out")
+        return "failed", {"name": contract["name"], "error": "timeout"}
+
     def _dry_run_deployment(self, category: Optional[str] = None) -> Dict:
         """Perform dry run of deployment"""
         print(f"\n[INFO] DRY RUN MODE")
@@ -918,7 +1014,9 @@ class EnhancedConxianDeployer:
 
         return ordered_contracts
 
-    def _deploy_single_contract(self, contract: Dict) -> Optional[str]:
+    def _deploy_single_contract(
+        self, contract: Dict, nonce: Optional[int] = None
+    ) -> Optional[str]:
         """Deploy a single contract using Stacks SDK via Node.js wrapper"""
         print(f"Deploying {contract['name']}...")
         
@@ -949,6 +1047,8 @@ class EnhancedConxianDeployer:
                 self.config.get("DEPLOYER_PRIVKEY", ""),
                 self.config.get("NETWORK", "testnet")
             ]
+            if nonce is not None:
+                cmd.append(str(nonce))
             
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             output = json.loads(result.stdout)
@@ -2,7 +2,7 @@ const { makeContractDeploy, broadcastTransaction, AnchorMode } = require('@stack
 const { STACKS_MAINNET, STACKS_TESTNET, STACKS_DEVNET } = require('@stacks/network');
 const fs = require('fs');
 
-async function deploy(contractName, codeBody, privateKey, networkName) {
+async function deploy(contractName, codeBody, privateKey, networkName, nonce) {
   try {
     let network;
     if (networkName.toLowerCase() === 'mainnet') network = STACKS_MAINNET;
@@ -17,6 +17,9 @@ async function deploy(contractName, codeBody, privateKey, networkName) {
       anchorMode: AnchorMode.Any,
       postConditionMode: 1, // Allow
     };
+
+    // Explicit nonce lets callers broadcast several deploys concurrently
+    if (nonce !== undefined) txOptions.nonce = BigInt(nonce);
     
     const transaction = await makeContractDeploy(txOptions);
     const broadcastResponse = await broadcastTransaction({ transaction, network });
@@ -35,14 +38,14 @@ async function deploy(contractName, codeBody, privateKey, networkName) {
 if (require.main === module) {
   const args = process.argv.slice(2);
   if (args.length < 4) {
-    console.error('Usage: node deployer.js <contractName> <path> <privateKey> <network>');
+    console.error('Usage: node deployer.js <contractName> <path> <privateKey> <network> [nonce]');
     process.exit(1);
   }
   
-  const [contractName, contractPath, privateKey, networkName] = args;
+  const [contractName, contractPath, privateKey, networkName, nonce] = args;
   const codeBody = fs.readFileSync(contractPath, 'utf8');
   
-  deploy(contractName, codeBody, privateKey, networkName).then(result => {
+  deploy(contractName, codeBody, privateKey, networkName, nonce).then(result => {
     console.log(JSON.stringify(result));
     if (!result.success) process.exit(1);
   });
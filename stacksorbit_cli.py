@@ -1015,8 +1015,10 @@ class UltimateStacksOrbit:
             monitor_thread = self.monitor.start_monitoring()
 
             try:
-                while self.monitor.is_monitoring:
-                    time.sleep(1)
+                # Bolt ⚡: Block on the stop event instead of waking every second
+                while self.monitor.is_monitoring.is_set():
+                    if self.monitor.stop_event.wait(timeout=30):
+                        break
             except KeyboardInterrupt:
                 pass
 
@@ -1054,15 +1056,14 @@ class UltimateStacksOrbit:
         # Initialize verifier
         from deployment_verifier import DeploymentVerifier
 
-        verifier = DeploymentVerifier(
+        with DeploymentVerifier(
             network=config.get("NETWORK", "testnet"), config=config
-        )
-
-        # Run comprehensive verification
-        results = verifier.run_comprehensive_verification(expected_contracts)
+        ) as verifier:
+            # Run comprehensive verification
+            results = verifier.run_comprehensive_verification(expected_contracts)
 
-        # Print detailed summary
-        verifier.print_verification_summary()
+            # Print detailed summary
+            verifier.print_verification_summary()
 
         # Exit with appropriate code
         return 0 if results["overall_status"] == "success" else 1
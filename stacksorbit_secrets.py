@@ -10,6 +10,14 @@ import os
 import functools
 import json
 import re
+import threading
+from typing import Callable
+
+# Bolt ⚡: Prefer orjson (C extension) for JSON persistence when installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SECRET_KEYS = {
     "HIRO_API_KEY",
@@ -443,7 +451,28 @@ NETWORK_ADDR_RE_MAP = {
 }
 
 
-def save_secure_config(filepath: str, config: object, json_format: bool = False, redact: bool = True, indent: int = 2):
+def _dump_json(data: object, indent: int = 2) -> bytes:
+    """
+    Bolt ⚡: Serialize data to UTF-8 JSON bytes, using orjson when available.
+    orjson only supports 2-space indentation, and rejects some types stdlib json
+    accepts (e.g. non-string keys), so those cases fall back to json.dumps.
+    """
+    if orjson is not None and indent in (None, 2):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent == 2 else 0)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=indent).encode("utf-8")
+
+
+def save_secure_config(
+    filepath: str,
+    config: object,
+    json_format: bool = False,
+    redact: bool = True,
+    indent: int = 2,
+    durable: bool = False,
+):
     """
     🛡️ Sentinel: Atomically and securely save configuration to a file.
     Uses a temporary file and os.replace for atomicity, and ensures
@@ -452,11 +481,15 @@ def save_secure_config(filepath: str, config: object, json_format: bool = False,
 
     Bolt ⚡: Added 'redact' and 'indent' parameters to allow performance-critical
     caching systems to skip expensive O(N) redaction and reduce I/O overhead.
+    If durable is True, the temp file is fsync'd before the swap so the
+    new contents survive a crash; leave it off for frequently rewritten caches.
     """
     if not filepath:
         return
 
-    temp_path = f"{filepath}.tmp"
+    # Per-writer temp name so concurrent saves of the same file never share
+    # (and truncate) one temp file before the atomic swap.
+    temp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
         # Bolt ⚡: Use umask to ensure the file is created with restricted permissions (0600).
         # This is more secure than chmod-ing after creation as there is no window of exposure.
@@ -465,39 +498,48 @@ def save_secure_config(filepath: str, config: object, json_format: bool = False,
             old_umask = os.umask(0o077)
 
         try:
-            with open(temp_path, "w", encoding="utf-8") as f:
-                if json_format:
-                    # 🛡️ Sentinel: Automatically redact before saving as JSON (if enabled)
-                    # Bolt ⚡: Optimization - Skip redaction for public/cached data to save CPU.
-                    if redact:
-                        redacted = redact_recursive(config)
-                    else:
-                        redacted = config
-                    json.dump(redacted, f, indent=indent)
-                # Handle both dict and string content
-                elif isinstance(config, dict):
-                    for key, value in config.items():
-                        # 🛡️ Sentinel: Security Enforcer.
-                        # Explicitly skip any known secrets, potential sensitive keys, OR values that look like secrets.
-                        # This prevents secrets from being saved to disk even if stored under generic key names.
-                        # 🛡️ Sentinel: Regression Fix - allow sensitive keys if the value is a safe placeholder.
-                        if (not is_sensitive_key(str(key)) and not is_sensitive_value(str(value))) or is_placeholder(str(value)):
-                            # 🛡️ Sentinel: Sanitize key and value to prevent injection and format breakage.
-                            # We remove newlines and equals signs from keys to prevent configuration injection.
-                            safe_key = (
-                                str(key)
-                                .replace("\n", "")
-                                .replace("\r", "")
-                                .replace("=", "")
-                            )
-                            safe_val = (
-                                str(value).replace("\n", "\\n").replace("\r", "\\r")
-                            )
-                            f.write(f"{safe_key}={safe_val}\n")
+            if json_format:
+                # 🛡️ Sentinel: Automatically redact before saving as JSON (if enabled)
+                # Bolt ⚡: Optimization - Skip redaction for public/cached data to save CPU.
+                if redact:
+                    redacted = redact_recursive(config)
                 else:
-                    # If it's a string (pre-formatted), we just write it.
-                    # Caller is responsible for filtering secrets if passing a string.
-                    f.write(str(config))
+                    redacted = config
+                # Bolt ⚡: Serialize straight to bytes to skip the text codec layer.
+                with open(temp_path, "wb") as f:
+                    f.write(_dump_json(redacted, indent))
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+            else:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    # Handle both dict and string content
+                    if isinstance(config, dict):
+                        for key, value in config.items():
+                            # 🛡️ Sentinel: Security Enforcer.
+                            # Explicitly skip any known secrets, potential sensitive keys, OR values that look like secrets.
+                            # This prevents secrets from being saved to disk even if stored under generic key names.
+                            # 🛡️ Sentinel: Regression Fix - allow sensitive keys if the value is a safe placeholder.
+                            if (not is_sensitive_key(str(key)) and not is_sensitive_value(str(value))) or is_placeholder(str(value)):
+                                # 🛡️ Sentinel: Sanitize key and value to prevent injection and format breakage.
+                                # We remove newlines and equals signs from keys to prevent configuration injection.
+                                safe_key = (
+                                    str(key)
+                                    .replace("\n", "")
+                                    .replace("\r", "")
+                                    .replace("=", "")
+                                )
+                                safe_val = (
+                                    str(value).replace("\n", "\\n").replace("\r", "\\r")
+                                )
+                                f.write(f"{safe_key}={safe_val}\n")
+                    else:
+                        # If it's a string (pre-formatted), we just write it.
+                        # Caller is responsible for filtering secrets if passing a string.
+                        f.write(str(config))
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
         finally:
             if old_umask is not None:
                 os.umask(old_umask)
@@ -531,25 +573,43 @@ def set_secure_permissions(filepath: str):
         pass
 
 
-def is_safe_path(base_dir: str, target_path: str) -> bool:
+def safe_path_checker(base_dir: str) -> Callable[[str], bool]:
     """
-    🛡️ Sentinel: Check if a target path is safe and stays within the base directory.
-    Prevents path traversal attacks by ensuring the resolved path is within the base.
+    🛡️ Sentinel: Build an is_safe_path check bound to one base directory.
+    Bolt ⚡: The base is resolved once, so checking many targets (e.g. every
+    contract in a Clarinet.toml) costs one realpath per target instead of two.
     """
-    if not target_path or not base_dir:
-        return False
+    if not base_dir:
+        return lambda target_path: False
     try:
-        # Reject absolute paths immediately for configuration-based file resolution.
-        if os.path.isabs(target_path):
-            return False
-
         # 🛡️ Sentinel: Use realpath to resolve all symlinks before path validation.
         # This prevents Path Traversal via symlinks to outside files.
         base = os.path.realpath(base_dir)
-        target = os.path.realpath(os.path.join(base, target_path))
-
-        # os.path.commonpath returns the longest common sub-path of each passed pathname.
-        # If it matches the base, then target is within base.
-        return os.path.commonpath([base, target]) == base
     except Exception:
-        return False
+        return lambda target_path: False
+
+    def check(target_path: str) -> bool:
+        if not target_path:
+            return False
+        try:
+            # Reject absolute paths immediately for configuration-based file resolution.
+            if os.path.isabs(target_path):
+                return False
+
+            target = os.path.realpath(os.path.join(base, target_path))
+
+            # os.path.commonpath returns the longest common sub-path of each passed pathname.
+            # If it matches the base, then target is within base.
+            return os.path.commonpath([base, target]) == base
+        except Exception:
+            return False
+
+    return check
+
+
+def is_safe_path(base_dir: str, target_path: str) -> bool:
+    """
+    🛡️ Sentinel: Check if a target path is safe and stays within the base directory.
+    Prevents path traversal attacks by ensuring the resolved path is within the base.
+    """
+    return safe_path_checker(base_dir)(target_path)
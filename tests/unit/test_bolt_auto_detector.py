@@ -80,6 +80,22 @@ def test_project_files_cache_is_dict():
         assert "test.clar" in detector.project_files_cache[cache_key]
         assert detector.project_files_cache[cache_key]["test.clar"]["mtime"] == 12345
 
+def test_scan_skips_stat_for_irrelevant_files(tmp_path):
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "token.clar").write_text("(define-data-var x int 0)")
+    (tmp_path / "deployment-manifest.json").write_text("{}")
+    (tmp_path / "README.md").write_text("# readme")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.clar").write_text("")
+
+    detector = GenericStacksAutoDetector()
+    detector._scan_project_files(tmp_path)
+
+    files = detector.project_files_cache[str(tmp_path)]
+    assert set(files) == {"contracts/token.clar", "deployment-manifest.json"}
+    assert detector._clar_files[str(tmp_path)] == ["contracts/token.clar"]
+    assert isinstance(GenericStacksAutoDetector.IGNORE_DIRS, frozenset)
+
 def test_stat_avoidance_in_clarinet_toml():
     detector = GenericStacksAutoDetector()
     directory = Path("test_project")
@@ -120,3 +136,306 @@ def test_stat_avoidance_in_clarinet_toml():
                     # Filter calls to check if any call was for the contract file
                     contract_stat_calls = [c for c in mock_stat.call_args_list if "my-contract.clar" in str(c)]
                     assert len(contract_stat_calls) == 0
+
+def test_clarinet_toml_and_env_parsed_once_until_changed(tmp_path):
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+    clarinet_path = tmp_path / "Clarinet.toml"
+    clarinet_path.write_text('[project]\nname = "demo"\n\n[contracts.token]\npath = "contracts/token.clar"\n')
+    env_path = tmp_path / ".env"
+    env_path.write_text("NETWORK=testnet\nSYSTEM_ADDRESS=ST1TEST\n")
+
+    with patch.object(
+        GenericStacksAutoDetector, "_read_toml", wraps=GenericStacksAutoDetector._read_toml
+    ) as mock_toml, patch.object(
+        GenericStacksAutoDetector, "_read_env_file", wraps=GenericStacksAutoDetector._read_env_file
+    ) as mock_env:
+        detector._parse_generic_clarinet_toml(tmp_path)
+        analysis = detector._analyze_clarinet_toml(tmp_path)
+        detector._validate_configuration(env_path)
+        network = detector._extract_network_from_config(env_path)
+
+        assert analysis["contracts"] == 1
+        assert network == "testnet"
+        assert mock_toml.call_count == 1
+        assert mock_env.call_count == 1
+
+        # A changed file is re-parsed
+        clarinet_path.write_text('[contracts.token]\npath = "a.clar"\n\n[contracts.vault]\npath = "b.clar"\n')
+        assert detector._analyze_clarinet_toml(tmp_path)["contracts"] == 2
+        assert mock_toml.call_count == 2
+
+def test_file_hash_reuses_persisted_entry_until_file_changes(tmp_path):
+    import hashlib
+
+    contract = tmp_path / "token.clar"
+    contract.write_text("(define-data-var x int 0)")
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+    detector.state["contract_hashes"] = {}
+    detector.HASH_ALGORITHM = "sha256"
+
+    expected = hashlib.sha256(contract.read_bytes()).hexdigest()
+    assert detector._calculate_file_hash(contract) == expected
+
+    with patch("builtins.open") as mock_open:
+        assert detector._calculate_file_hash(contract) == expected
+        mock_open.assert_not_called()
+
+    # Legacy MD5 entries without an algorithm tag are re-hashed
+    entry = detector.state["contract_hashes"][str(contract)]
+    entry.pop("algorithm")
+    entry["hash"] = "legacy"
+    assert detector._calculate_file_hash(contract) == expected
+
+def test_manual_clarinet_parse_uses_section_then_simple_format(tmp_path):
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "token.clar").write_text("")
+    (tmp_path / "contracts" / "vault.clar").write_text("")
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+    clarinet_path = tmp_path / "Clarinet.toml"
+
+    clarinet_path.write_text(
+        '[contracts.token]\npath = "contracts/token.clar"\n'
+        '[contracts.vault]\npath = "contracts/vault.clar"\ndepends_on = ["token"]\n'
+    )
+    contracts = detector._parse_clarinet_toml_manually(clarinet_path)
+    assert [(c["name"], c["path"]) for c in contracts] == [
+        ("token", "contracts/token.clar"),
+        ("vault", "contracts/vault.clar"),
+    ]
+
+    clarinet_path.write_text('token = "contracts/token.clar"\n')
+    contracts = detector._parse_clarinet_toml_manually(clarinet_path)
+    assert [c["path"] for c in contracts] == ["contracts/token.clar"]
+
+def test_clarinet_contract_metadata_costs_at_most_one_stat(tmp_path):
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "token.clar").write_text("(define-data-var x int 0)")
+    (tmp_path / "contracts" / "vault.clar").write_text("")
+    (tmp_path / "Clarinet.toml").write_text(
+        '[contracts.token]\npath = "contracts/token.clar"\n'
+        '[contracts.vault]\npath = "contracts/vault.clar"\n'
+        '[contracts.missing]\npath = "contracts/missing.clar"\n'
+    )
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+    detector.project_files_cache[str(tmp_path)] = {
+        "contracts/token.clar": {"rel_path": "contracts/token.clar", "mtime": 9999, "size": 500}
+    }
+
+    with patch("pathlib.Path.exists", autospec=True, side_effect=Path.exists) as mock_exists:
+        contracts = detector._parse_generic_clarinet_toml(tmp_path)
+
+    assert [c["name"] for c in contracts] == ["token", "vault"]
+    assert contracts[0]["modified"] == 9999
+    assert contracts[1]["size"] == 0
+    # Only Clarinet.toml itself is probed with exists()
+    assert [call.args[0].name for call in mock_exists.call_args_list] == ["Clarinet.toml"]
+
+def test_contract_cache_invalidated_when_sources_change(tmp_path):
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "token.clar").write_text("")
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+
+    detector._scan_project_files(tmp_path)
+    first = detector._comprehensive_generic_contract_detection(tmp_path)
+    assert [c["name"] for c in first] == ["token"]
+
+    # A fresh scan of an unchanged tree keeps the cached results
+    detector._scan_project_files(tmp_path)
+    with patch.object(detector, "_categorize_contracts") as mock_categorize:
+        assert detector._comprehensive_generic_contract_detection(tmp_path) is first
+        mock_categorize.assert_not_called()
+
+    (tmp_path / "contracts" / "vault.clar").write_text("")
+    detector._scan_project_files(tmp_path)
+    names = {c["name"] for c in detector._comprehensive_generic_contract_detection(tmp_path)}
+    assert names == {"token", "vault"}
+
+def test_parent_directory_fallback_sees_edits_between_runs(tmp_path, monkeypatch):
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "token.clar").write_text("")
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    detector = GenericStacksAutoDetector(project_root=project)
+
+    with patch("builtins.print"), patch("builtins.input", return_value="n"):
+        assert detector._detect_current_setup()["contracts_found"] == 0
+
+    # Edit and add contracts in the parent between detection runs
+    (tmp_path / "contracts" / "token.clar").write_text(";; token v2")
+    (tmp_path / "contracts" / "vault.clar").write_text("")
+
+    with patch("builtins.print"), patch("builtins.input", return_value="y"):
+        result = detector._detect_current_setup()
+
+    sizes = {c["name"]: c["size"] for c in result["contracts"]}
+    assert sizes == {"token": len(";; token v2"), "vault": 0}
+
+def test_detection_progress_is_batched_but_flushed_before_prompts(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    detector = GenericStacksAutoDetector(project_root=project)
+    events = []
+
+    def fake_print(*args, **kwargs):
+        events.append(("print", " ".join(str(a) for a in args)))
+
+    def fake_input(prompt):
+        events.append(("input", prompt))
+        return ""
+
+    with patch("builtins.print", side_effect=fake_print), patch("builtins.input", side_effect=fake_input):
+        detector._detect_current_setup()
+        detector._flush_log()
+
+    kinds = [kind for kind, _ in events]
+    assert kinds == ["print", "input"]
+    # Everything queued before the prompt went out in a single print
+    assert "No contracts found" in events[0][1]
+    assert "Please specify the path" in events[0][1]
+
+def test_contracts_hashed_once_after_dedupe_with_cache_hits_skipped(tmp_path):
+    import hashlib
+
+    (tmp_path / "contracts").mkdir()
+    for name in ("token", "vault", "oracle"):
+        (tmp_path / "contracts" / f"{name}.clar").write_text(f";; {name}")
+    (tmp_path / "Clarinet.toml").write_text('[contracts.token]\npath = "contracts/token.clar"\n')
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+    detector.state["contract_hashes"] = {}
+    detector.HASH_POOL_MIN_BYTES = 0  # exercise the thread pool path
+    detector.HASH_ALGORITHM = "sha256"
+
+    detector._scan_project_files(tmp_path)
+    with patch.object(
+        detector, "_calculate_file_hash", wraps=detector._calculate_file_hash
+    ) as mock_hash:
+        contracts = detector._comprehensive_generic_contract_detection(tmp_path)
+
+    # token.clar is listed in Clarinet.toml and found by the scan, but hashed once
+    assert mock_hash.call_count == 3
+    for contract in contracts:
+        expected = hashlib.sha256(Path(contract["full_path"]).read_bytes()).hexdigest()
+        assert contract["hash"] == expected
+
+    # Unchanged files are served from the persisted hashes without a read
+    detector.contract_cache.clear()
+    with patch.object(detector, "_calculate_file_hash") as mock_hash:
+        detector._comprehensive_generic_contract_detection(tmp_path)
+    mock_hash.assert_not_called()
+
+@pytest.mark.parametrize("conxian", [False, True])
+def test_category_regexes_match_plain_substring_semantics(conxian):
+    detector = GenericStacksAutoDetector(use_conxian_mode=conxian)
+    names = ["SIP-010-Trait", "sip010-token", "dex-router-v2", "my-oracle", "Fixed-Point-Math", "widget"]
+    for name in names:
+        expected = next(
+            (
+                cat
+                for cat, patterns in detector.contract_categories.items()
+                if any(p.lower() in name.lower() for p in patterns)
+            ),
+            "general",
+        )
+        assert detector._determine_contract_category(name) == expected
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_read_json_with_and_without_orjson(tmp_path, use_orjson):
+    import enhanced_auto_detector
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    path = tmp_path / "state.json"
+    path.write_text('{"contract_hashes": {"a.clar": {"hash": "x", "size": 1}}, "note": "caf\\u00e9"}')
+
+    with patch.object(enhanced_auto_detector, "orjson", enhanced_auto_detector.orjson if use_orjson else None):
+        data = enhanced_auto_detector._read_json(path)
+
+    assert data == {"contract_hashes": {"a.clar": {"hash": "x", "size": 1}}, "note": "café"}
+
+def test_file_hash_uses_xxh3_when_installed(tmp_path):
+    xxhash = pytest.importorskip("xxhash")
+
+    contract = tmp_path / "token.clar"
+    contract.write_text("(define-data-var x int 0)")
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+    detector.state["contract_hashes"] = {}
+
+    assert detector.HASH_ALGORITHM == "xxh3_64"
+    assert detector._calculate_file_hash(contract) == xxhash.xxh3_64(contract.read_bytes()).hexdigest()
+    assert detector.state["contract_hashes"][str(contract)]["algorithm"] == "xxh3_64"
+
+def test_toml_parser_resolved_once(tmp_path):
+    import enhanced_auto_detector
+
+    path = tmp_path / "Clarinet.toml"
+    path.write_text('[project]\nname = "demo"\n')
+
+    with patch.object(enhanced_auto_detector, "_TOML_PARSER", None):
+        assert GenericStacksAutoDetector._read_toml(path) == {"project": {"name": "demo"}}
+        parser = enhanced_auto_detector._TOML_PARSER
+        assert parser and parser[1] in ("rb", "r")
+        assert enhanced_auto_detector._get_toml_parser() is parser
+
+    # Without any TOML parser the caller falls back to manual parsing
+    with patch.object(enhanced_auto_detector, "_TOML_PARSER", False):
+        assert GenericStacksAutoDetector._read_toml(path) is None
+
+    # Before Python 3.11, the tomli backport is preferred over the toml package
+    import sys
+    import types
+
+    fake_tomli = types.SimpleNamespace(load=lambda f: {"parsed_by": "tomli", "raw": f.read()})
+    with patch.object(enhanced_auto_detector, "_TOML_PARSER", None), patch.dict(
+        sys.modules, {"tomllib": None, "tomli": fake_tomli}
+    ):
+        data = GenericStacksAutoDetector._read_toml(path)
+    assert data["parsed_by"] == "tomli"
+    assert isinstance(data["raw"], bytes)
+
+def test_directory_scan_paths_match_pathlib(tmp_path):
+    (tmp_path / "contracts" / "nested").mkdir(parents=True)
+    for rel in ("root.clar", "contracts/token.clar", "contracts/nested/pool.v2.clar"):
+        (tmp_path / rel).write_text("")
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+
+    contracts = detector._efficient_directory_scan(tmp_path)
+
+    assert len(contracts) == 3
+    for contract in contracts:
+        expected = tmp_path / contract["path"]
+        assert contract["full_path"] == str(expected)
+        assert contract["name"] == expected.stem
+
+def test_deployment_files_read_without_is_file_probe(tmp_path):
+    (tmp_path / "deployment").mkdir()
+    (tmp_path / "deployment" / "a.json").write_text('{"deployment": {"successful": [{"name": "token", "tx_id": "0x1"}]}}')
+    (tmp_path / "deployment" / "b.json").write_text("{}")
+    detector = GenericStacksAutoDetector(project_root=tmp_path)
+    detector._scan_project_files(tmp_path)
+
+    # A file removed after the scan is skipped quietly
+    (tmp_path / "deployment" / "b.json").unlink()
+    with patch("pathlib.Path.is_file") as mock_is_file:
+        manifests = detector._parse_deployment_manifests(tmp_path)
+        artifacts = detector._find_deployment_artifacts(tmp_path)
+
+    mock_is_file.assert_not_called()
+    assert [m["name"] for m in manifests] == ["token"]
+    assert [Path(a["path"]).name for a in artifacts] == ["a.json"]
+    assert detector._log_buffer == []
+
+def test_priority_sees_keywords_overlapping_earlier_matches():
+    detector = GenericStacksAutoDetector()
+    priority_order = [p.lower() for p in detector.PRIORITY_ORDER]
+
+    def naive_priority(name):
+        return next((i for i, p in enumerate(priority_order) if p in name.lower()), len(priority_order))
+
+    names = ["position-nft", "non-fungible", "nftrait", "vaultraits", "math-lib", "widget"]
+    ordered = detector._sort_contracts_by_generic_dependencies([{"name": n} for n in names])
+
+    assert [c["name"] for c in ordered] == sorted(names, key=naive_priority)
+    for name in names:
+        assert detector._priority_cache[name] == naive_priority(name)
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import time
@@ -14,6 +15,12 @@ class TestBoltCacheBypass(unittest.TestCase):
     """Verify Bolt's cache bypass optimization."""
 
     def setUp(self):
+        # Keep logs/, the API cache and saved results out of the working tree
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self._tmp.name)
+
         self.test_cache_path = "logs/test_bolt_cache.json"
         if os.path.exists(self.test_cache_path):
             os.remove(self.test_cache_path)
@@ -80,5 +87,22 @@ class TestBoltCacheBypass(unittest.TestCase):
         self.assertEqual(res3['status'], "success")
         self.assertEqual(mock_get.call_count, 2)
 
+    @patch('requests.Session.get')
+    def test_pending_transactions_not_cached(self, mock_get):
+        """Verify pending transactions are refetched until they settle."""
+        tx_id = "0x" + "c" * 64
+
+        pending = MagicMock(status_code=200)
+        pending.json.return_value = {"tx_status": "pending"}
+        success = MagicMock(status_code=200)
+        success.json.return_value = {"tx_status": "success"}
+        mock_get.side_effect = [pending, success]
+
+        self.assertEqual(self.monitor.get_transaction_info(tx_id)['tx_status'], "pending")
+        self.assertEqual(self.monitor.get_transaction_info(tx_id)['tx_status'], "success")
+        # Settled result is served from cache
+        self.assertEqual(self.monitor.get_transaction_info(tx_id)['tx_status'], "success")
+        self.assertEqual(mock_get.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,163 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import json
+import threading
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from deployment_monitor import DeploymentMonitor
+
+
+class TestBoltMonitorEvents(unittest.TestCase):
+    """Verify the monitoring loop blocks on events instead of sleeping."""
+
+    def setUp(self):
+        # Keep logs/, the API cache and saved results out of the working tree
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self._tmp.name)
+
+        self.monitor = DeploymentMonitor(network="testnet", config={})
+        self.monitor.use_websocket = False
+
+    @patch.object(DeploymentMonitor, "save_monitoring_summary")
+    @patch.object(DeploymentMonitor, "_check_network_health")
+    @patch.object(DeploymentMonitor, "_check_for_new_deployments", return_value=False)
+    @patch.object(DeploymentMonitor, "check_api_status", return_value={"status": "online"})
+    def test_stop_wakes_sleeping_loop(self, *_):
+        self.monitor.min_poll_interval = 60
+        self.monitor.current_poll_interval = 60
+
+        thread = self.monitor.start_monitoring()
+        self.assertTrue(self.monitor.is_monitoring.is_set())
+        # A second start reuses the running loop
+        self.assertIs(self.monitor.start_monitoring(), thread)
+
+        self.monitor.stop_monitoring()
+        # The loop is parked in a 60s+ wait; stopping must wake it right away
+        thread.join(timeout=2)
+
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(self.monitor.is_monitoring.is_set())
+
+
+    @patch.object(DeploymentMonitor, "_check_network_health")
+    @patch.object(DeploymentMonitor, "_check_for_new_deployments", return_value=False)
+    def test_websocket_block_events_wake_followers(self, mock_check, _):
+        ws = MagicMock()
+        messages = [json.dumps({"jsonrpc": "2.0", "method": "block", "params": {"height": 42}})]
+
+        def recv():
+            if messages:
+                return messages.pop()
+            self.monitor.is_monitoring.clear()
+            return json.dumps({"jsonrpc": "2.0", "id": 1, "result": {}})
+
+        ws.recv.side_effect = recv
+        self.monitor.is_monitoring.set()
+
+        with patch("websocket.create_connection", return_value=ws):
+            self.assertTrue(self.monitor._stream_events())
+
+        self.assertEqual(self.monitor.last_block_height, 42)
+        self.assertTrue(self.monitor.new_block.is_set())
+        subscribed = [json.loads(call.args[0])["params"]["event"] for call in ws.send.call_args_list]
+        self.assertEqual(subscribed, ["block"])
+        ws.close.assert_called_once()
+
+    def test_websocket_unavailable_falls_back_to_polling(self):
+        with patch("websocket.create_connection", side_effect=OSError("refused")):
+            self.assertFalse(self.monitor._stream_events())
+
+    @patch.object(DeploymentMonitor, "get_deployed_contracts", return_value=[{"contract_id": "x"}])
+    @patch.object(DeploymentMonitor, "get_account_info", return_value={"nonce": 0})
+    @patch.object(DeploymentMonitor, "check_api_status", return_value={"status": "online"})
+    def test_polling_tick_fetches_each_endpoint_once(self, mock_status, mock_account, mock_contracts):
+        self.monitor.config["SYSTEM_ADDRESS"] = "ST1PQHQKV0RJXZFY1DGX8MNSNYVE3VGZJSRTPGZGM"
+        statuses = []
+
+        def callback(status):
+            statuses.append(status)
+            self.monitor.stop_event.set()
+
+        self.monitor.is_monitoring.set()
+        self.monitor._monitoring_loop(callback)
+
+        mock_status.assert_called_once_with(bypass_cache=True)
+        mock_account.assert_called_once()
+        mock_contracts.assert_called_once()
+        self.assertEqual(statuses[0]["deployed_contracts"], 1)
+        # Idle tick backs off gently from the 3s floor
+        self.assertEqual(self.monitor.current_poll_interval, 4.5)
+
+    @patch.object(DeploymentMonitor, "get_deployed_contracts")
+    @patch.object(DeploymentMonitor, "get_account_info")
+    @patch.object(DeploymentMonitor, "check_api_status", return_value={"status": "online"})
+    def test_contract_list_refetched_only_on_nonce_change(self, _, mock_account, mock_contracts):
+        address = "ST1PQHQKV0RJXZFY1DGX8MNSNYVE3VGZJSRTPGZGM"
+        mock_account.side_effect = [{"nonce": 1}, {"nonce": 1}, {"nonce": 2}]
+        mock_contracts.side_effect = [[{"contract_id": "a"}], [{"contract_id": "a"}, {"contract_id": "b"}]]
+
+        self.assertEqual(len(self.monitor.fetch_status(address)[2]), 1)
+        self.assertEqual(len(self.monitor.fetch_status(address)[2]), 1)
+        self.assertEqual(mock_contracts.call_count, 1)
+
+        self.assertEqual(len(self.monitor.fetch_status(address)[2]), 2)
+        mock_contracts.assert_called_with(address, bypass_cache=True)
+
+    def test_summary_saves_coalesce_on_background_writer(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_save():
+            calls.append(threading.current_thread().name)
+            started.set()
+            release.wait(timeout=2)
+
+        with patch.object(self.monitor, "save_monitoring_summary", side_effect=slow_save):
+            self.monitor.schedule_summary_save()
+            writer = self.monitor._summary_writer
+            self.assertTrue(started.wait(timeout=2))
+            # Requests made during the in-flight write collapse into one more write
+            self.monitor.schedule_summary_save()
+            self.monitor.schedule_summary_save()
+            release.set()
+            writer.join(timeout=2)
+
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(calls, ["monitoring-summary-writer"] * 2)
+        self.assertIsNone(self.monitor._summary_writer)
+
+    def test_failed_summary_save_keeps_draining(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def failing_save():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                started.set()
+                release.wait(timeout=2)
+                raise OSError("disk full")
+
+        with patch.object(self.monitor, "save_monitoring_summary", side_effect=failing_save):
+            self.monitor.schedule_summary_save()
+            writer = self.monitor._summary_writer
+            self.assertTrue(started.wait(timeout=2))
+            self.monitor.schedule_summary_save()
+            release.set()
+            writer.join(timeout=2)
+
+        self.assertFalse(writer.is_alive())
+        # The pending request still ran after the failed write
+        self.assertEqual(calls, [0, 1])
+        self.assertIsNone(self.monitor._summary_writer)
+
+
+if __name__ == '__main__':
+    unittest.main()
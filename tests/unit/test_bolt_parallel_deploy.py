@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_conxian_deployment import EnhancedConxianDeployer
+
+
+class TestBoltParallelDeploy(unittest.TestCase):
+    """Verify Bolt's batched concurrent deployment."""
+
+    def setUp(self):
+        self.monitor = MagicMock()
+        self.monitor.get_account_info.return_value = {"nonce": 7}
+        self.monitor.wait_for_confirmation.return_value = True
+        self.deployer = EnhancedConxianDeployer(
+            {"SYSTEM_ADDRESS": "ST1PQHQKV0RJXZFY1DGX8MNSNYVE3VGZJSRTPGZGM", "BATCH_SIZE": "2"},
+            monitor=self.monitor,
+        )
+
+    def test_batches_respect_size_and_dependencies(self):
+        contracts = [
+            {"name": "a"},
+            {"name": "b"},
+            {"name": "c"},
+            {"name": "d", "depends_on": ["c"]},
+        ]
+        batches = self.deployer._plan_deployment_batches(contracts, 2)
+        self.assertEqual([[c["name"] for c in b] for b in batches], [["a", "b"], ["c"], ["d"]])
+
+    @patch("enhanced_conxian_deployment.time.sleep")
+    @patch.object(EnhancedConxianDeployer, "_save_deployment_results")
+    def test_failed_broadcast_leaves_no_nonce_gap(self, mock_save, mock_sleep):
+        contracts = [{"name": "a"}, {"name": "b"}, {"name": "c"}, {"name": "d"}]
+
+        def fake_deploy(contract, nonce=None):
+            if contract["name"] == "b":
+                raise RuntimeError("boom")
+            if contract["name"] == "c":
+                return None
+            return f"0x{nonce}"
+
+        with patch.object(self.deployer, "_get_deployment_list", return_value=contracts), \
+                patch.object(self.deployer, "_deploy_single_contract", side_effect=fake_deploy):
+            results = self.deployer.deploy_conxian()
+
+        # Failed broadcasts don't consume a nonce, so d reuses b's slot
+        self.assertEqual(results["successful"], [{"name": "a", "tx_id": "0x7"}, {"name": "d", "tx_id": "0x8"}])
+        self.assertEqual(
+            results["failed"],
+            [{"name": "b", "error": "boom"}, {"name": "c", "error": "deployment failed"}],
+        )
+        # One account lookup for the whole deployment
+        self.monitor.get_account_info.assert_called_once()
+
+
+    @patch("enhanced_conxian_deployment.time.sleep")
+    @patch.object(EnhancedConxianDeployer, "_save_deployment_results")
+    def test_unknown_nonce_confirms_each_contract_before_the_next(self, mock_save, mock_sleep):
+        self.monitor.get_account_info.return_value = None
+        contracts = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+        events = []
+
+        def fake_deploy(contract, nonce=None):
+            events.append(("deploy", contract["name"], nonce))
+            return f"0x{contract['name']}"
+
+        def fake_confirm(tx_id, timeout):
+            # Slow enough that an overlapping broadcast would land first
+            threading.Event().wait(0.05)
+            events.append(("confirm", tx_id))
+            return True
+
+        self.monitor.wait_for_confirmation.side_effect = fake_confirm
+        with patch.object(self.deployer, "_get_deployment_list", return_value=contracts), \
+                patch.object(self.deployer, "_deploy_single_contract", side_effect=fake_deploy):
+            results = self.deployer.deploy_conxian()
+
+        # The deploy script picks each nonce, so broadcasts never overlap
+        self.assertEqual(events, [
+            ("deploy", "a", None), ("confirm", "0xa"),
+            ("deploy", "b", None), ("confirm", "0xb"),
+            ("deploy", "c", None), ("confirm", "0xc"),
+        ])
+        self.assertEqual([r["name"] for r in results["successful"]], ["a", "b", "c"])
+
+if __name__ == '__main__':
+    unittest.main()
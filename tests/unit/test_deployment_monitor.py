@@ -1,6 +1,8 @@
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import time
+import json
 import os
 import sys
 from pathlib import Path
@@ -8,13 +10,19 @@ from pathlib import Path
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from deployment_monitor import DeploymentMonitor
+from deployment_monitor import API_TIMEOUT, DeploymentMonitor, _parse_json_response, create_api_session
+import requests
 
 class TestDeploymentMonitorCache(unittest.TestCase):
     """Tests for the caching functionality in DeploymentMonitor."""
 
     def setUp(self):
         """Set up a DeploymentMonitor instance for testing."""
+        # Keep logs/, the API cache and saved results out of the working tree
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self._tmp.name)
         # Use a temporary cache file for testing to avoid interference
         self.test_cache_path = "logs/test_api_cache.json"
         if os.path.exists(self.test_cache_path):
@@ -63,5 +71,107 @@ class TestDeploymentMonitorCache(unittest.TestCase):
         # The mock should now have been called a second time
         self.assertEqual(mock_get.call_count, 2)
 
+    @patch.object(DeploymentMonitor, '_save_cache')
+    @patch('requests.Session.get')
+    def test_cache_evicts_oldest_entries(self, mock_get, mock_save):
+        """Verify the cache stays bounded by evicting the oldest entries."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"tx_status": "success"}
+        mock_get.return_value = mock_response
+
+        self.monitor.redacted_cache = {}
+        self.monitor.cache_maxsize = 3
+        for i in range(5):
+            self.monitor.get_transaction_info(f"0x{i}")
+
+        self.assertEqual(len(self.monitor.cache), 3)
+        self.assertEqual(len(self.monitor.redacted_cache), 3)
+        self.assertNotIn(("get_transaction_info", ("0x0",), ()), self.monitor.cache)
+        self.assertIn(("get_transaction_info", ("0x4",), ()), self.monitor.cache)
+
+    def test_persisted_cache_round_trips_keys(self):
+        """Verify entries written to disk are served again after a restart."""
+        self.monitor.redacted_cache = {}
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = MagicMock(status_code=200)
+            mock_get.return_value.json.return_value = {"results": []}
+            self.monitor.get_recent_transactions("ST1", limit=5)
+
+        persisted = json.loads(json.dumps(self.monitor.redacted_cache))
+        restored = DeploymentMonitor._restore_cache(persisted)
+        self.assertIn(("get_recent_transactions", ("ST1",), (("limit", 5),)), restored)
+
+        # Entries from the old string-keyed format are discarded
+        legacy = {"check_api_status__": {"timestamp": 0, "data": {}}}
+        self.assertEqual(DeploymentMonitor._restore_cache(legacy), {})
+        self.assertEqual(legacy, {})
+
+    @patch.object(DeploymentMonitor, '_save_cache')
+    @patch('deployment_monitor.time.time')
+    @patch('requests.Session.get')
+    def test_endpoint_ttl_overrides_default_expiry(self, mock_get, mock_time, mock_save):
+        """Verify per-endpoint TTLs take precedence over cache_expiry."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"nonce": 1}
+        mock_get.return_value = mock_response
+        self.monitor.cache_expiry = 300
+        address = "ST1PQHQKV0RJXZFY1DGX8MNSNYVE3VGZJSRTPGZGM"
+
+        mock_time.return_value = 1000.0
+        self.monitor.get_account_info(address)
+        mock_time.return_value = 1004.0
+        self.monitor.get_account_info(address)
+        self.assertEqual(mock_get.call_count, 1)
+
+        # Account info uses a 5s TTL even though the default expiry is 300s
+        mock_time.return_value = 1006.0
+        self.monitor.get_account_info(address)
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_parse_json_response_reads_raw_bytes(self):
+        """Verify responses are decoded from their raw body."""
+        response = requests.Response()
+        response._content = b'{"nonce": 3, "balance": "0x10"}'
+        self.assertEqual(_parse_json_response(response), {"nonce": 3, "balance": "0x10"})
+
+    @patch.object(DeploymentMonitor, 'get_contract_details')
+    def test_contract_details_batch_dedupes_ids(self, mock_details):
+        """Verify batched detail fetches map each unique id to its result."""
+        mock_details.side_effect = lambda cid: {"source_code": cid} if cid != "ST1.b" else None
+        result = self.monitor.get_contract_details_batch(["ST1.a", "ST1.b", "ST1.a", "ST1.c"])
+
+        self.assertEqual(result, {"ST1.a": {"source_code": "ST1.a"}, "ST1.b": None, "ST1.c": {"source_code": "ST1.c"}})
+        self.assertEqual(mock_details.call_count, 3)
+
+    @patch.object(DeploymentMonitor, '_save_cache')
+    def test_every_endpoint_uses_connect_read_timeout(self, mock_save):
+        """Verify each API request carries the (connect, read) timeout."""
+        self.monitor.session = MagicMock()
+        self.monitor.session.get.return_value.content = b'{}'
+
+        self.monitor.check_api_status()
+        self.monitor.get_account_info("ST1")
+        self.monitor.get_transaction_info("0x1")
+        self.monitor.get_deployed_contracts("ST1")
+        self.monitor.get_recent_transactions("ST1")
+        self.monitor.get_contract_details("ST1.a")
+
+        calls = self.monitor.session.get.call_args_list
+        self.assertEqual(len(calls), 6)
+        for call in calls:
+            self.assertEqual(call.kwargs["timeout"], API_TIMEOUT)
+
+    def test_session_retries_only_gateway_statuses_on_get(self):
+        """Verify the shared session fails fast on connect/read errors."""
+        retry = create_api_session().get_adapter("https://api.testnet.hiro.so").max_retries
+
+        self.assertEqual(retry.connect, 0)
+        self.assertEqual(retry.read, 0)
+        self.assertEqual(set(retry.allowed_methods), {"GET"})
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertFalse(retry.is_retry("POST", 503))
+
 if __name__ == '__main__':
     unittest.main()
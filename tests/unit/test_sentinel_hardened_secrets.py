@@ -1,6 +1,8 @@
 import unittest
 import os
 import json
+import tempfile
+import threading
 from stacksorbit_secrets import (
     redact_recursive,
     is_sensitive_key,
@@ -48,5 +50,32 @@ class TestSentinelHardenedSecrets(unittest.TestCase):
             if os.path.exists(filepath + ".tmp"):
                 os.remove(filepath + ".tmp")
 
+    def test_concurrent_json_saves_stay_atomic(self):
+        """Concurrent durable saves of one file never leave partial JSON or temp files."""
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = os.path.join(tmp, "results.json")
+            errors = []
+
+            def save(i):
+                try:
+                    for _ in range(20):
+                        save_secure_config(
+                            filepath, {"writer": i, "checks": list(range(200))},
+                            json_format=True, durable=True,
+                        )
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=save, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            self.assertEqual(errors, [])
+            with open(filepath) as f:
+                self.assertEqual(json.load(f)["checks"], list(range(200)))
+            self.assertEqual(os.listdir(tmp), ["results.json"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,8 @@ import os
 import unittest
 import shutil
 import tempfile
-from stacksorbit_secrets import is_safe_path
+from unittest.mock import patch
+from stacksorbit_secrets import is_safe_path, safe_path_checker
 
 class TestSentinelPathSafety(unittest.TestCase):
 
@@ -48,5 +49,18 @@ class TestSentinelPathSafety(unittest.TestCase):
     def test_should_reject_relative_traversal(self):
         self.assertFalse(is_safe_path(self.test_dir, "../outside/secret.txt"))
 
+    def test_checker_resolves_base_once(self):
+        with patch("stacksorbit_secrets.os.path.realpath", side_effect=os.path.realpath) as mock_realpath:
+            is_safe = safe_path_checker(self.test_dir)
+            self.assertTrue(is_safe("a.clar"))
+            self.assertTrue(is_safe("contracts/b.clar"))
+            self.assertFalse(is_safe("../outside/secret.txt"))
+            self.assertFalse(is_safe(self.secret_file))
+            self.assertFalse(is_safe(""))
+
+        # One realpath for the base plus one per relative target
+        self.assertEqual(mock_realpath.call_count, 4)
+        self.assertFalse(safe_path_checker("")("a.clar"))
+
 if __name__ == '__main__':
     unittest.main()
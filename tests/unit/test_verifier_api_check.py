@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from unittest.mock import patch
 import os
@@ -9,6 +10,13 @@ from deployment_verifier import DeploymentVerifier
 
 
 class TestVerifierApiConnectivity(unittest.TestCase):
+    def setUp(self):
+        # Keep logs/, the API cache and saved results out of the working tree
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self._tmp.name)
+
     @patch('deployment_verifier.DeploymentMonitor.check_api_status')
     @patch('deployment_verifier.DeploymentMonitor.get_account_info')
     @patch('deployment_verifier.DeploymentMonitor.get_deployed_contracts')
@@ -23,6 +31,19 @@ class TestVerifierApiConnectivity(unittest.TestCase):
         self.assertIn('API Connectivity', results['checks'])
         self.assertFalse(results['checks']['API Connectivity']['passed'])
 
+        # Checks that need the API are skipped rather than run against it
+        mock_account.assert_not_called()
+        mock_deployed.assert_not_called()
+        self.assertTrue(results['checks']['Account Status']['skipped'])
+        self.assertEqual(list(results['checks'])[0], 'API Connectivity')
+        self.assertEqual(len(results['checks']), 7)
+
+        # A later run with the API back online does not reuse the skips
+        mock_api.return_value = {'status': 'online', 'block_height': 1}
+        results = verifier.run_comprehensive_verification([])
+        self.assertNotIn('skipped', results['checks']['Account Status'])
+        mock_account.assert_called()
+
 
 if __name__ == '__main__':
     unittest.main()
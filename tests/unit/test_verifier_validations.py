@@ -1,18 +1,180 @@
+import tempfile
+import time
 import unittest
+from unittest.mock import MagicMock, patch
 import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from deployment_verifier import DeploymentVerifier
+from deployment_verifier import DeploymentVerifier, load_expected_contracts, main
 
 
 class TestVerifierValidations(unittest.TestCase):
+    def setUp(self):
+        # Keep logs/, the API cache and saved results out of the working tree
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self._tmp.name)
+
     def test_missing_address_raises(self):
         verifier = DeploymentVerifier(network='testnet', config={})
         with self.assertRaises(ValueError):
             verifier.run_comprehensive_verification([])
 
+    def test_transaction_history_counts_recent_deployments(self):
+        verifier = DeploymentVerifier(network='testnet', config={})
+        now = int(time.time())
+        verifier.monitor = MagicMock()
+        verifier.monitor.get_recent_transactions.return_value = [
+            {"tx_type": "smart_contract", "burn_block_time": now - 60},
+            {"tx_type": "contract_call", "burn_block_time": now - 120},
+            {"tx_type": "smart_contract", "burn_block_time": now - 3 * 86400},
+            {"tx_type": "smart_contract", "burn_block_time_iso": "2000-01-01T00:00:00Z"},
+            {"tx_type": "token_transfer"},
+        ]
+
+        result = verifier._verify_transaction_history("ST1TEST")
+
+        self.assertTrue(result["passed"])
+        self.assertEqual(result["details"]["total_transactions"], 5)
+        self.assertEqual(result["details"]["recent_transactions"], 2)
+        self.assertEqual(result["details"]["deployment_transactions"], 1)
+
+    def test_shared_lookups_fetched_once_per_run(self):
+        verifier = DeploymentVerifier(
+            network='testnet', config={"SYSTEM_ADDRESS": "ST1TEST"}
+        )
+        verifier.monitor = MagicMock()
+        verifier.monitor.check_api_status.return_value = {"status": "online"}
+        verifier.monitor.get_account_info.return_value = {"balance": "0x0", "nonce": 1}
+        verifier.monitor.get_deployed_contracts.return_value = []
+        verifier.monitor.get_recent_transactions.return_value = []
+        verifier.monitor.get_contract_details_batch.return_value = {}
+        verifier._save_verification_results = MagicMock()
+
+        with patch("builtins.print") as mock_print:
+            verifier.run_comprehensive_verification([])
+            verifier.run_comprehensive_verification([])
+
+        # Each run looks these up once, even though two checks use each
+        self.assertEqual(verifier.monitor.check_api_status.call_count, 2)
+        self.assertEqual(verifier.monitor.get_account_info.call_count, 2)
+        self.assertEqual(verifier.monitor.get_deployed_contracts.call_count, 2)
+        verifier.monitor.get_deployed_contracts.assert_called_with("ST1TEST", bypass_cache=True)
+
+        # Both runs reuse one long-lived check pool until the verifier closes
+        pool = verifier._pool
+        self.assertIsNotNone(pool)
+        verifier.close()
+        self.assertIsNone(verifier._pool)
+        with self.assertRaises(RuntimeError):
+            pool.submit(print)
+
+        # Check status lines are printed together, in declared check order
+        status = mock_print.call_args_list[1].args[0].splitlines()
+        check_names = list(verifier.verification_results["checks"])
+        self.assertEqual(len(status), len(check_names))
+        for line, name in zip(status, check_names):
+            self.assertIn(name, line)
+
+    def test_load_expected_contracts_skips_commented_sections(self):
+        original_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "Clarinet.toml"), "w") as f:
+                f.write(
+                    '[project]\nname = "demo"\n\n'
+                    '[contracts.cxd-token]\npath = "contracts/cxd-token.clar"\n\n'
+                    '# [contracts.old-vault]\n# path = "contracts/old-vault.clar"\n\n'
+                    '[contracts.vault]\npath = "contracts/vault.clar"\n'
+                )
+            try:
+                os.chdir(tmp)
+                self.assertEqual(load_expected_contracts(), ["cxd-token", "vault"])
+            finally:
+                os.chdir(original_cwd)
+
+    def test_load_expected_contracts_without_tomllib_or_tomli(self):
+        with open("Clarinet.toml", "w") as f:
+            f.write(
+                '[contracts.cxd-token]\npath = "contracts/cxd-token.clar"\n\n'
+                '[contracts.vault]\npath = "contracts/vault.clar"\n'
+            )
+
+        # Python 3.8-3.10 without tomli falls back to the toml package
+        with patch.dict(sys.modules, {"tomllib": None, "tomli": None}):
+            self.assertEqual(load_expected_contracts(), ["cxd-token", "vault"])
+
+        # With no TOML parser at all, the section headers are still found
+        with patch.dict(sys.modules, {"tomllib": None, "tomli": None, "toml": None}):
+            self.assertEqual(load_expected_contracts(), ["cxd-token", "vault"])
+
+    def test_contract_deployment_reports_missing_in_order(self):
+        verifier = DeploymentVerifier(network='testnet', config={})
+        verifier.monitor = MagicMock()
+        verifier.monitor.get_deployed_contracts.return_value = [
+            {"contract_id": "ST1TEST.cxd-token"},
+            {"contract_id": "ST1TEST.vault"},
+        ]
+
+        result = verifier._verify_contract_deployment(
+            "ST1TEST", ["oracle", "cxd-token", "dex-factory", "oracle", "vault"]
+        )
+
+        self.assertFalse(result["passed"])
+        self.assertEqual(result["details"]["expected"], 4)
+        self.assertEqual(result["details"]["verified"], 2)
+        self.assertEqual(result["details"]["missing_contracts"], ["oracle", "dex-factory"])
+
+    def test_recommendations_follow_failed_checks(self):
+        verifier = DeploymentVerifier(network='testnet', config={})
+        verifier.verification_results["checks"] = {
+            "API Connectivity": {"passed": True},
+            "Account Status": {"passed": False},
+            "Contract Deployment": {
+                "passed": False,
+                "details": {"missing_contracts": ["cxd-token", "vault"]},
+            },
+        }
+
+        verifier._generate_recommendations()
+
+        self.assertEqual(
+            verifier.verification_results["recommendations"],
+            [
+                "Fund account with sufficient STX balance",
+                "Deploy missing contracts: cxd-token, vault",
+                "Wait for network stability before continuing",
+            ],
+        )
+
+    def test_main_loads_named_and_prefixed_environment_keys(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env_path = os.path.join(tmp, ".env")
+            with open(env_path, "w") as f:
+                f.write("SYSTEM_ADDRESS=ST1FILE\nCUSTOM_SETTING=file\nBARE_KEY\n")
+            environ = {
+                "CUSTOM_SETTING": "env",
+                "BARE_KEY": "from-env",
+                "STACKS_EXTRA": "1",
+                "HIRO_API_KEY": "secret",
+                "UNRELATED": "x",
+            }
+            argv = ["deployment_verifier.py", "--config", env_path, "--contracts", "a"]
+            with patch.dict(os.environ, environ, clear=True), \
+                    patch("sys.argv", argv), \
+                    patch("deployment_verifier.DeploymentVerifier") as mock_verifier:
+                main()
+
+        config = mock_verifier.call_args.kwargs["config"]
+        self.assertEqual(config["SYSTEM_ADDRESS"], "ST1FILE")
+        self.assertEqual(config["CUSTOM_SETTING"], "env")
+        self.assertEqual(config["BARE_KEY"], "from-env")
+        self.assertEqual(config["STACKS_EXTRA"], "1")
+        self.assertEqual(config["HIRO_API_KEY"], "secret")
+        self.assertNotIn("UNRELATED", config)
+
 
 if __name__ == '__main__':
     unittest.main()